@@ -24,9 +24,11 @@ import argparse
 import json
 import re
 import sys
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, FrozenSet, List, Set, Union
 
 # Minimum number of significant keywords two texts must share to be considered
 # covering the same decision.
@@ -36,72 +38,94 @@ KEYWORD_MATCH_THRESHOLD = 2
 MIN_KEYWORD_LENGTH = 4
 
 # Common stop-words to exclude from keyword matching.
-STOP_WORDS: Set[str] = {
-    "with",
-    "this",
-    "that",
-    "from",
-    "have",
-    "will",
-    "been",
-    "were",
-    "they",
-    "also",
-    "more",
-    "some",
-    "such",
-    "when",
-    "then",
-    "than",
-    "what",
-    "which",
-    "each",
-    "into",
-    "over",
-    "used",
-    "uses",
-    "make",
-    "made",
-    "using",
-    "because",
-    "before",
-    "after",
-    "session",
-    "agent",
-    "code",
-    "file",
-    "files",
-    "project",
-    "team",
-    "approach",
-    "pattern",
-    "option",
-    "current",
-    "change",
-}
-
-# Patterns in CHANGELOG.md that indicate an architectural decision was made.
-CHANGELOG_DECISION_PATTERNS = [
-    # "Decisions made" section entries
-    re.compile(
-        r"^\s*[-*]\s*\*\*([^*]+)\*\*(?:\s*\(ADR[- ]\d+\))?:\s*(.{20,150})",
-        re.MULTILINE,
-    ),
-    # Session "decisions made" section
-    re.compile(
-        r"###\s+Decisions\s+made\s*\n((?:.*\n)*?)(?=###|\Z)",
-        re.MULTILINE | re.IGNORECASE,
-    ),
-]
+STOP_WORDS: FrozenSet[str] = frozenset(
+    {
+        "with",
+        "this",
+        "that",
+        "from",
+        "have",
+        "will",
+        "been",
+        "were",
+        "they",
+        "also",
+        "more",
+        "some",
+        "such",
+        "when",
+        "then",
+        "than",
+        "what",
+        "which",
+        "each",
+        "into",
+        "over",
+        "used",
+        "uses",
+        "make",
+        "made",
+        "using",
+        "because",
+        "before",
+        "after",
+        "session",
+        "agent",
+        "code",
+        "file",
+        "files",
+        "project",
+        "team",
+        "approach",
+        "pattern",
+        "option",
+        "current",
+        "change",
+    }
+)
+
+# Tokenizer for significant-keyword extraction.
+KEYWORD_TOKEN_RE = re.compile(r"[a-zA-Z]+")
+
+# Single-pass scanner for CHANGELOG.md. Alternatives are tried in order at each
+# position, so one walk over the file yields session headers, the start and end
+# of each "Decisions made" subsection, and the decision bullets inside it.
+# The bullet marker, bold title and parenthetical never cross a line break, so
+# a failed bullet candidate backtracks over at most one line. The body stops
+# short of any "###" so an inline heading still closes the subsection.
+CHANGELOG_SCAN_RE = re.compile(
+    r"(?P<session>^##\s+Session\s+(?P<session_id>\d+)"
+    r"\s+[-\u2013\u2014]+\s+\d{4}-\d{2}-\d{2})"
+    r"|(?P<decisions>(?i:###\s+Decisions\s+made)\s*\n)"
+    r"|(?P<heading>###)"
+    r"|(?P<bullet>^[ \t]*[-*][ \t]*\*\*(?P<title>[^*\n]+)\*\*"
+    r"(?:[ \t]*\([^)\n]*\))?:\s*(?P<body>(?:(?!###).){20,300}))",
+    re.MULTILINE,
+)
+
+# An explicit "ADR-NNN" / "ADR NNN" reference; group 1 is the ADR number.
+ADR_REFERENCE_RE = re.compile(r"\bADR[- ](\d+)\b", re.IGNORECASE)
+
+# Runs of non-word characters, collapsed to "-" when slugging a decision title.
+NON_WORD_RUN_RE = re.compile(r"\W+")
+
+# ADR number from a docs/adr/ filename stem.
+ADR_FILENAME_RE = re.compile(r"ADR-(\d+)")
+
+# First H1 or H2 heading of an ADR file, minus any "ADR-NNN:" prefix.
+ADR_TITLE_RE = re.compile(r"^#{1,2}\s+(?:ADR[^:\n]*:\s*)?(.+)$", re.MULTILINE)
+
+# Upper bound on concurrent ADR file reads in load_adrs.
+MAX_READ_WORKERS = 8
 
 # Patterns in DECISIONS.md for DEC entries.
 DECISIONS_MD_PATTERN = re.compile(
-    r"^##\s+DEC-(\d+)\s+--\s+(.+?)\s+--\s+\d{4}-\d{2}-\d{2}",
+    r"^##[ \t]+DEC-(\d+)[ \t]+--[ \t]+(.+?)[ \t]+--[ \t]+\d{4}-\d{2}-\d{2}",
     re.MULTILINE,
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Decision:
     """An architectural decision extracted from CHANGELOG.md or DECISIONS.md."""
 
@@ -109,9 +133,14 @@ class Decision:
     identifier: str  # e.g. "DEC-001" or "Session 003 - Stripe choice"
     title: str
     body: str
+    # Normalized title used for deduplication; derived from title.
+    title_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "title_key", self.title.strip().lower())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Adr:
     """An ADR file read from docs/adr/."""
 
@@ -121,7 +150,7 @@ class Adr:
     content: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CoverageResult:
     """Coverage result for a single decision."""
 
@@ -133,8 +162,11 @@ class CoverageResult:
 
 def extract_keywords(text: str) -> Set[str]:
     """Extract significant lowercase words from a text block."""
-    words = re.findall(r"[a-zA-Z]+", text.lower())
-    return {w for w in words if len(w) >= MIN_KEYWORD_LENGTH and w not in STOP_WORDS}
+    return {
+        w
+        for w in KEYWORD_TOKEN_RE.findall(text.lower())
+        if len(w) >= MIN_KEYWORD_LENGTH and w not in STOP_WORDS
+    }
 
 
 def keyword_overlap(text_a: str, text_b: str) -> int:
@@ -154,13 +186,16 @@ def parse_decisions_md(path: Path) -> List[Decision]:
         return []
     decisions: List[Decision] = []
 
-    matches = list(DECISIONS_MD_PATTERN.finditer(content))
-    for i, match in enumerate(matches):
-        number = match.group(1).zfill(3)
-        title = match.group(2).strip()
-
-        start = match.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+    # Keep only (offset, number, title) per header rather than whole Match
+    # objects; each body runs to the next header's offset.
+    headers = [
+        (match.start(), match.group(1), match.group(2))
+        for match in DECISIONS_MD_PATTERN.finditer(content)
+    ]
+    ends = [offset for offset, _, _ in headers[1:]] + [len(content)]
+    for (start, number, title), end in zip(headers, ends):
+        number = number.zfill(3)
+        title = title.strip()
         body = content[start:end]
 
         decisions.append(
@@ -187,47 +222,37 @@ def parse_changelog_decisions(path: Path) -> List[Decision]:
         return []
     decisions: List[Decision] = []
 
-    # Find each session block.
-    session_header = re.compile(
-        r"^##\s+Session\s+(\d+)\s+[-\u2013\u2014]+\s+(\d{4}-\d{2}-\d{2})",
-        re.MULTILINE,
-    )
-    session_matches = list(session_header.finditer(content))
-
-    for i, session_match in enumerate(session_matches):
-        session_id = session_match.group(1).zfill(3)
-        start = session_match.start()
-        end = (
-            session_matches[i + 1].start()
-            if i + 1 < len(session_matches)
-            else len(content)
-        )
-        session_body = content[start:end]
-
-        # Find the "Decisions made" subsection.
-        dec_section = re.search(
-            r"###\s+Decisions\s+made\s*\n((?:(?!###).)*)",
-            session_body,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if not dec_section:
-            continue
-
-        decisions_text = dec_section.group(1)
-
-        # Each bullet in the decisions section is a separate decision.
-        bullets = re.findall(
-            r"^\s*[-*]\s*\*\*([^*]+)\*\*(?:\s*\([^)]*\))?:\s*(.{20,300})",
-            decisions_text,
-            re.MULTILINE,
-        )
-
-        for title, body in bullets:
-            title_clean = title.strip()
+    # Walk the file once. Only the first "Decisions made" subsection of each
+    # session counts, and it ends at the next ### heading or session header.
+    session_id = ""
+    in_decisions = False
+    section_seen = False
+    for match in CHANGELOG_SCAN_RE.finditer(content):
+        kind = match.lastgroup
+        if kind == "session":
+            session_id = match.group("session_id").zfill(3)
+            in_decisions = False
+            section_seen = False
+        elif kind == "decisions":
+            if session_id and not section_seen:
+                in_decisions = True
+                section_seen = True
+            else:
+                in_decisions = False
+        elif kind == "heading":
+            in_decisions = False
+        elif in_decisions:
             # Skip if the bullet explicitly references an ADR — it is already covered.
-            if re.search(r"\bADR[- ]\d+\b", title + body, re.IGNORECASE):
+            # Search the title and body spans in place rather than slicing and
+            # concatenating them.
+            if ADR_REFERENCE_RE.search(
+                content, *match.span("title")
+            ) or ADR_REFERENCE_RE.search(content, *match.span("body")):
                 continue
 
+            title_clean = match.group("title").strip()
+            body = match.group("body")
+
             decisions.append(
                 Decision(
                     source="CHANGELOG.md",
@@ -240,29 +265,46 @@ def parse_changelog_decisions(path: Path) -> List[Decision]:
     return decisions
 
 
+def _read_adr_file(adr_path: Path) -> Union[str, Exception]:
+    """Read an ADR file, returning the read error instead of raising it."""
+    try:
+        return adr_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        return exc
+
+
 def load_adrs(adr_dir: Path) -> List[Adr]:
     """Load all ADR files from docs/adr/, excluding the template (ADR-000)."""
     if not adr_dir.is_dir():
         return []
 
+    # Skip the template.
+    adr_paths = [
+        adr_path
+        for adr_path in sorted(adr_dir.glob("ADR-[0-9]*.md"))
+        if not adr_path.stem.startswith("ADR-000")
+    ]
+    if not adr_paths:
+        return []
+
+    # Reads are I/O-bound, so fetch the files concurrently. Warnings are still
+    # reported from this thread, in filename order.
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_READ_WORKERS, len(adr_paths))
+    ) as executor:
+        contents = list(executor.map(_read_adr_file, adr_paths))
+
     adrs: List[Adr] = []
-    for adr_path in sorted(adr_dir.glob("ADR-[0-9]*.md")):
-        # Skip the template.
-        if adr_path.stem.startswith("ADR-000"):
+    for adr_path, content in zip(adr_paths, contents):
+        if isinstance(content, Exception):
+            print(f"Warning: Could not read {adr_path}: {content}", file=sys.stderr)
             continue
 
-        match = re.match(r"ADR-(\d+)", adr_path.stem)
+        match = ADR_FILENAME_RE.match(adr_path.stem)
         number = match.group(1) if match else "???"
 
         # Extract the title from the first H1 or H2 heading.
-        try:
-            content = adr_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
-            print(f"Warning: Could not read {adr_path}: {exc}", file=sys.stderr)
-            continue
-        title_match = re.search(r"^#{1,2}\s+ADR[^:]*:\s*(.+)$", content, re.MULTILINE)
-        if not title_match:
-            title_match = re.search(r"^#{1,2}\s+(.+)$", content, re.MULTILINE)
+        title_match = ADR_TITLE_RE.search(content)
         title = title_match.group(1).strip() if title_match else adr_path.stem
 
         adrs.append(
@@ -284,26 +326,38 @@ def check_coverage(
     """For each decision, determine whether an ADR covers it."""
     results: List[CoverageResult] = []
 
-    for decision in decisions:
-        # Build the text to match against.
-        decision_text = f"{decision.title} {decision.body}"
+    # Tokenize every ADR once up front rather than once per decision.
+    # Tokenizing title and body separately and taking the union gives the same
+    # set as tokenizing "title body", without building the concatenated copy.
+    adr_keywords = [
+        extract_keywords(adr.title) | extract_keywords(adr.content) for adr in adrs
+    ]
 
-        covering: List[str] = []
-        for adr in adrs:
-            adr_text = f"{adr.title} {adr.content}"
-            # Also check if the DECISIONS.md entry explicitly references this ADR.
-            explicit_ref = bool(
-                re.search(
-                    rf"\bADR[- ]{adr.number}\b",
-                    decision.body,
-                    re.IGNORECASE,
-                )
+    # Inverted index: keyword -> indices of the ADRs containing it. Counting
+    # postings per decision replaces a full set intersection against every ADR.
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for index, adr_kw in enumerate(adr_keywords):
+        for keyword in adr_kw:
+            postings[keyword].append(index)
+
+    for decision in decisions:
+        # An explicit reference to an existing ADR settles coverage on its own,
+        # so keyword extraction only runs for decisions that cite none.
+        referenced = {m.group(1) for m in ADR_REFERENCE_RE.finditer(decision.body)}
+        covering: List[str] = [adr.number for adr in adrs if adr.number in referenced]
+
+        if not covering:
+            decision_keywords = extract_keywords(decision.title) | extract_keywords(
+                decision.body
             )
-            if (
-                explicit_ref
-                or keyword_overlap(decision_text, adr_text) >= KEYWORD_MATCH_THRESHOLD
-            ):
-                covering.append(adr.number)
+            shared: Counter[int] = Counter()
+            for keyword in decision_keywords:
+                shared.update(postings.get(keyword, ()))
+            covering = [
+                adrs[index].number
+                for index in sorted(shared)
+                if shared[index] >= KEYWORD_MATCH_THRESHOLD
+            ]
 
         covered = len(covering) > 0
 
@@ -311,7 +365,7 @@ def check_coverage(
             recommendation = f"Covered by ADR-{covering[0]}."
         else:
             # Generate a recommendation based on the decision title.
-            slug = re.sub(r"\W+", "-", decision.title.lower()).strip("-")[:40]
+            slug = NON_WORD_RUN_RE.sub("-", decision.title.lower()).strip("-")[:40]
             next_num = "NNN"  # Placeholder — the human assigns the real number.
             recommendation = (
                 f"Create docs/adr/ADR-{next_num}-{slug}.md using the template in "
@@ -388,9 +442,9 @@ def run(
     decisions_md_entries = parse_decisions_md(decisions_path)
 
     # Merge, deduplicating by title (DECISIONS.md is authoritative).
-    decisions_md_titles = {d.title.lower() for d in decisions_md_entries}
+    decisions_md_titles = {d.title_key for d in decisions_md_entries}
     changelog_unique = [
-        d for d in changelog_decisions if d.title.lower() not in decisions_md_titles
+        d for d in changelog_decisions if d.title_key not in decisions_md_titles
     ]
     all_decisions = decisions_md_entries + changelog_unique
 
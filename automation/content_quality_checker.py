@@ -14,10 +14,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import stat
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from itertools import product
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 # Quality rules per file category
@@ -48,33 +54,138 @@ TEMPLATE_RULES: Dict[str, Any] = {
     "description": "Governance template",
 }
 
+# Upper bound on threads used to read governance files concurrently
+MAX_READ_WORKERS = 8
 
-def count_lines(file_path: Path) -> int:
-    """Return the number of non-empty lines in a file."""
+# Directory listings: path -> (mtime_ns, sorted file names)
+_DIR_LISTING_CACHE: Dict[str, Tuple[int, List[str]]] = {}
+
+# Longest header text kept as a section name
+MAX_SECTION_NAME = 512
+
+# Markdown section header: 1-3 hashes, then spaces or tabs on the same line.
+# The capture is bounded so a pathological header line costs O(1) to keep.
+SECTION_HEADER_RE = re.compile(
+    rf"^#{{1,3}}[ \t]+([^\n]{{1,{MAX_SECTION_NAME}}})", re.MULTILINE
+)
+
+# Line boundaries str.splitlines() honours besides "\n"
+EXTRA_LINE_BREAKS = "\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+def _read_content(file_path: Union[str, Path]) -> Optional[str]:
+    """Read a file as UTF-8 text, returning None if it cannot be read.
+
+    Accepts a plain string path as well as a Path. Decodes the raw bytes in one
+    call and only translates line endings when a carriage return is present,
+    matching read_text()'s universal newlines.
+    """
     try:
-        content = file_path.read_text(encoding="utf-8")
+        with open(file_path, "rb") as handle:
+            content = handle.read().decode("utf-8")
     except (OSError, UnicodeDecodeError):
-        return 0
-    return len([line for line in content.splitlines() if line.strip()])
+        return None
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _count_content_lines(content: str) -> int:
+    """Return the number of non-empty lines in already-loaded content."""
+    return sum(1 for line in content.splitlines() if line.strip())
+
+
+def _extract_content_sections(content: str) -> List[str]:
+    """Extract lowercased #, ## and ### header names from already-loaded content."""
+    headers = SECTION_HEADER_RE.findall(content)
+    return [h.strip().lower() for h in headers]
+
+
+def _content_has_code_block(content: str) -> bool:
+    """Check whether already-loaded content contains a fenced code block."""
+    # A fence is ``` at the start of any line; a plain substring scan finds
+    # it without entering the regex engine.
+    return content.startswith("```") or "\n```" in content
+
+
+def _analyze_file(
+    file_path: Union[str, Path],
+    need_sections: bool = True,
+    need_code: bool = True,
+) -> Tuple[int, List[str], bool]:
+    """Read a file once and return (line count, section names, has code block).
+
+    Measurements the caller does not need are skipped and reported as [] or
+    False. Unreadable files yield (0, [], False), matching the standalone
+    helpers.
+    """
+    content = _read_content(file_path)
+    if content is None:
+        return 0, [], False
+    if need_sections:
+        return _scan_content(content)
+    # Without headers to collect, the C-level line and fence scans are cheaper
+    # than the fused Python loop.
+    return (
+        _count_content_lines(content),
+        [],
+        need_code and _content_has_code_block(content),
+    )
+
+
+def _scan_content(content: str) -> Tuple[int, List[str], bool]:
+    """Count lines, collect section headers and detect a fence in one pass.
+
+    Produces the same triple as the three content helpers above.
+    """
+    if any(ch in content for ch in EXTRA_LINE_BREAKS):
+        # splitlines() would break these lines differently; defer to the helpers.
+        return (
+            _count_content_lines(content),
+            _extract_content_sections(content),
+            _content_has_code_block(content),
+        )
+
+    line_count = 0
+    sections: List[str] = []
+    code_found = False
+
+    for line in content.split("\n"):
+        if not line.strip():
+            continue
+        line_count += 1
+        first = line[0]
+        if first == "#":
+            rest = line.lstrip("#")
+            if len(line) - len(rest) <= 3 and rest[:1] in (" ", "\t"):
+                name = rest.lstrip(" \t")
+                if name:
+                    sections.append(name[:MAX_SECTION_NAME].strip().lower())
+                elif len(rest) > 1:
+                    # SECTION_HEADER_RE backtracks and captures the last blank
+                    sections.append("")
+        elif first == "`" and not code_found and line.startswith("```"):
+            code_found = True
+
+    return line_count, sections, code_found
+
+
+def count_lines(file_path: Path) -> int:
+    """Return the number of non-empty lines in a file."""
+    content = _read_content(file_path)
+    return _count_content_lines(content) if content is not None else 0
 
 
 def extract_sections(file_path: Path) -> List[str]:
     """Extract all ## header names from a markdown file."""
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return []
-    headers = re.findall(r"^#{1,3}\s+(.+)$", content, re.MULTILINE)
-    return [h.strip().lower() for h in headers]
+    content = _read_content(file_path)
+    return _extract_content_sections(content) if content is not None else []
 
 
 def has_code_block(file_path: Path) -> bool:
     """Check whether a file contains a fenced code block or YAML example."""
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return False
-    return bool(re.search(r"^```", content, re.MULTILINE))
+    content = _read_content(file_path)
+    return _content_has_code_block(content) if content is not None else False
 
 
 def check_required_sections(
@@ -87,11 +198,46 @@ def check_required_sections(
     match_mode 'any': at least one required section must appear (OR).
     match_mode 'all': every required section must appear (AND).
     """
-    result: Dict[str, bool] = {}
-    for req in required:
-        found = any(req.lower() in s for s in sections)
-        result[req] = found
-    return result
+    if not sections:
+        return {req: False for req in required}
+    # Header names never span lines, so one substring search over the joined
+    # headers matches the same requirements as testing each header in turn.
+    joined = "\n".join(sections)
+    return {
+        req: req_lower in joined
+        for req, req_lower in zip(required, _lowered_sections(tuple(required)))
+    }
+
+
+@cache
+def _lowered_sections(required: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercase a rule's required section names once per distinct rule set."""
+    return tuple(req.lower() for req in required)
+
+
+def _grade_for(
+    non_empty: bool,
+    passes_lines: bool,
+    passes_sections: bool,
+    passes_code: bool,
+    generous: bool,
+) -> str:
+    """Grade a combination of pass flags; used to build GRADE_TABLE."""
+    if not passes_lines:
+        return "C" if non_empty else "F"
+    if not passes_sections:
+        return "C"
+    if not passes_code:
+        return "B"
+    # A requires generous content
+    return "A" if generous else "B"
+
+
+# Grades indexed by the 5-bit pattern
+# non_empty | passes_lines | passes_sections | passes_code | generous
+GRADE_TABLE: Tuple[str, ...] = tuple(
+    _grade_for(*flags) for flags in product((False, True), repeat=5)
+)
 
 
 def grade_file(
@@ -125,40 +271,44 @@ def grade_file(
     if requires_code and has_code is not None:
         passes_code = has_code
 
-    if not passes_lines:
-        return "F" if line_count == 0 else "C"
-    if not passes_sections:
-        return "C"
-    if not passes_code:
-        return "B"
-
-    # A requires generous content
-    if line_count >= min_lines * 2 and passes_sections and passes_code:
-        return "A"
-    return "B"
+    index = (
+        (line_count != 0) << 4
+        | passes_lines << 3
+        | passes_sections << 2
+        | bool(passes_code) << 1
+        | (line_count >= min_lines * 2)
+    )
+    return GRADE_TABLE[index]
 
 
 def check_governance_file(
-    repo: Path,
+    repo: Union[str, Path],
     relative_path: str,
     rules: Dict[str, Any],
 ) -> Dict[str, Any]:
     """Check a single governance file against its quality rules."""
-    file_path = repo / relative_path
-    exists = file_path.is_file()
-    line_count = count_lines(file_path) if exists else 0
-    sections = extract_sections(file_path) if exists else []
+    # Plain string paths skip pathlib's per-join object construction.
+    file_path = os.path.join(repo, relative_path)
+    exists = os.path.isfile(file_path)
 
     min_lines = rules.get("min_lines", 1)
     required_sections = rules.get("required_sections", [])
     match_mode = rules.get("section_match_mode", "all")
     requires_code = rules.get("requires_code_block", False)
 
+    # Read the file once, measuring only what these rules grade.
+    if exists:
+        line_count, sections, code_found = _analyze_file(
+            file_path, bool(required_sections), requires_code
+        )
+    else:
+        line_count, sections, code_found = 0, [], False
+
     section_check = None
     if required_sections:
         section_check = check_required_sections(sections, required_sections, match_mode)
 
-    code_present = has_code_block(file_path) if exists else None
+    code_present = code_found if exists else None
 
     quality_grade = grade_file(
         exists=exists,
@@ -188,70 +338,79 @@ def check_governance_file(
     return result
 
 
+def _list_dir_files(directory: Path) -> List[str]:
+    """Return the sorted names of regular files in a directory.
+
+    Listings are cached per directory and reused while its mtime is unchanged;
+    adding, removing or renaming an entry bumps the mtime and forces a rescan.
+    Returns an empty list if the path is not a directory.
+    """
+    try:
+        st = os.stat(directory)
+    except OSError:
+        return []
+    if not stat.S_ISDIR(st.st_mode):
+        return []
+
+    key = str(directory)
+    cached = _DIR_LISTING_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
+
+    # DirEntry carries the file type from readdir, avoiding a stat per entry.
+    with os.scandir(directory) as entries:
+        names = sorted(e.name for e in entries if e.is_file())
+    _DIR_LISTING_CACHE[key] = (st.st_mtime_ns, names)
+    return names
+
+
 def find_pattern_files(repo: Path) -> List[str]:
     """Find all markdown files in the patterns/ directory."""
-    patterns_dir = repo / "patterns"
-    if not patterns_dir.is_dir():
-        return []
     return [
-        f"patterns/{f.name}"
-        for f in sorted(patterns_dir.iterdir())
-        if f.is_file() and f.suffix == ".md" and f.name != "README.md"
+        f"patterns/{name}"
+        for name in _list_dir_files(repo / "patterns")
+        if name.endswith(".md") and name != "README.md"
     ]
 
 
 def find_template_files(repo: Path) -> List[str]:
     """Find all files in the templates/ directory."""
-    templates_dir = repo / "templates"
-    if not templates_dir.is_dir():
-        return []
     return [
-        f"templates/{f.name}"
-        for f in sorted(templates_dir.iterdir())
-        if f.is_file() and f.name != "README.md"
+        f"templates/{name}"
+        for name in _list_dir_files(repo / "templates")
+        if name != "README.md"
     ]
 
 
 def run_quality_check(repo: Path) -> Dict[str, Any]:
     """Run quality checks on all governance files in the repository."""
     repo = repo.resolve()
-    results: List[Dict[str, Any]] = []
-    all_pass = True
-
-    # Check core governance files
-    for filename, rules in QUALITY_RULES.items():
-        result = check_governance_file(repo, filename, rules)
-        results.append(result)
-        if result["quality_grade"] == "F":
-            all_pass = False
-
-    # Check pattern files
-    pattern_files = find_pattern_files(repo)
-    for pf in pattern_files:
-        result = check_governance_file(repo, pf, PATTERN_RULES)
-        results.append(result)
-        if result["quality_grade"] == "F":
-            all_pass = False
-
-    # Check template files
-    template_files = find_template_files(repo)
-    for tf in template_files:
-        result = check_governance_file(repo, tf, TEMPLATE_RULES)
-        results.append(result)
-        if result["quality_grade"] == "F":
-            all_pass = False
+    repo_str = str(repo)
+
+    # Core governance files, then patterns, then templates
+    tasks: List[Tuple[str, Dict[str, Any]]] = list(QUALITY_RULES.items())
+    tasks.extend((pf, PATTERN_RULES) for pf in find_pattern_files(repo))
+    tasks.extend((tf, TEMPLATE_RULES) for tf in find_template_files(repo))
+
+    # Each check is dominated by a blocking file read; threads overlap them.
+    # executor.map keeps results in task order.
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(tasks))) as executor:
+        results: List[Dict[str, Any]] = list(
+            executor.map(lambda task: check_governance_file(repo_str, *task), tasks)
+        )
 
+    grades = Counter(r["quality_grade"] for r in results)
     summary = {
         "total_files": len(results),
-        "grade_a": sum(1 for r in results if r["quality_grade"] == "A"),
-        "grade_b": sum(1 for r in results if r["quality_grade"] == "B"),
-        "grade_c": sum(1 for r in results if r["quality_grade"] == "C"),
-        "grade_f": sum(1 for r in results if r["quality_grade"] == "F"),
+        "grade_a": grades["A"],
+        "grade_b": grades["B"],
+        "grade_c": grades["C"],
+        "grade_f": grades["F"],
     }
 
     return {
-        "repository": str(repo),
-        "all_pass": all_pass,
+        "repository": repo_str,
+        "all_pass": summary["grade_f"] == 0,
         "summary": summary,
         "files": results,
     }
@@ -266,22 +425,21 @@ def format_text(report: Dict[str, Any]) -> str:
         "",
     ]
 
-    for file_result in report["files"]:
-        grade = file_result["quality_grade"]
-        status = "PASS" if grade != "F" else "FAIL"
-        lines.append(
-            f"  [{grade}] {file_result['file']}: "
-            f"{file_result['line_count']} lines — {status}"
-        )
+    # One f-string per file, collected in a single extend
+    lines.extend(
+        f"  [{r['quality_grade']}] {r['file']}: {r['line_count']} lines — "
+        f"{'FAIL' if r['quality_grade'] == 'F' else 'PASS'}"
+        for r in report["files"]
+    )
 
-    lines.append("")
     s = report["summary"]
-    lines.append(
+    lines += [
+        "",
         f"Summary: {s['grade_a']}A / {s['grade_b']}B / "
         f"{s['grade_c']}C / {s['grade_f']}F "
-        f"({s['total_files']} files)"
-    )
-    lines.append(f"Overall: {'PASS' if report['all_pass'] else 'FAIL'}")
+        f"({s['total_files']} files)",
+        f"Overall: {'PASS' if report['all_pass'] else 'FAIL'}",
+    ]
 
     return "\n".join(lines)
 
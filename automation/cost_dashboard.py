@@ -18,12 +18,14 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import re
 import sys
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # ---------------------------------------------------------------------------
 # ASCII chart helpers (self-contained — no shared module dependency)
@@ -33,22 +35,31 @@ BAR_FULL = "█"
 BAR_EMPTY = "░"
 
 
+@lru_cache(maxsize=128)
+def _bar(filled: int, width: int) -> str:
+    return BAR_FULL * filled + BAR_EMPTY * (width - filled)
+
+
 def ascii_bar(value: float, max_value: float, width: int = 20) -> str:
     """Return a filled ASCII progress bar string."""
     if max_value <= 0:
-        return BAR_EMPTY * width
+        return _bar(0, width)
     ratio = min(value / max_value, 1.0)
-    filled = round(ratio * width)
-    return BAR_FULL * filled + BAR_EMPTY * (width - filled)
+    return _bar(round(ratio * width), width)
+
+
+SPARK_BLOCKS = " ▁▂▃▄▅▆▇█"
+SPARK_TOP = len(SPARK_BLOCKS) - 1
 
 
 def sparkline(values: List[float]) -> str:
     """Return a compact unicode sparkline for a list of values."""
     if not values:
         return "—"
-    blocks = " ▁▂▃▄▅▆▇█"
-    max_v = max(values) if max(values) > 0 else 1
-    return "".join(blocks[round((v / max_v) * (len(blocks) - 1))] for v in values)
+    max_v = max(values)
+    if max_v <= 0:
+        max_v = 1
+    return "".join(SPARK_BLOCKS[round((v / max_v) * SPARK_TOP)] for v in values)
 
 
 def trend_arrow(values: List[float]) -> str:
@@ -67,72 +78,132 @@ def trend_arrow(values: List[float]) -> str:
 # COST_LOG.md parser
 # ---------------------------------------------------------------------------
 
-COST_TABLE_ROW_RE = re.compile(
-    r"^\|\s*(\d+)\s*\|\s*(\d{4}-\d{2}-\d{2})\s*\|\s*([^|]+?)\s*\|\s*(\d+)\s*\|"
-    r"\s*([^|]*?)\s*\|\s*\$([0-9.]+)\s*\|(?:\s*([^|]*?)\s*\|)?",
-    re.MULTILINE,
-)
+# Cost cell characters after the leading "$"
+COST_DIGITS = "0123456789."
+
+
+def _is_iso_date(value: str) -> bool:
+    """Return True for a YYYY-MM-DD string of decimal digits."""
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and (value[:4] + value[5:7] + value[8:]).isdecimal()
+    )
+
 
-# Model tier classification
-HAIKU_PATTERN = re.compile(r"haiku", re.IGNORECASE)
-SONNET_PATTERN = re.compile(r"sonnet", re.IGNORECASE)
-OPUS_PATTERN = re.compile(r"opus", re.IGNORECASE)
+def split_cost_row(line: str) -> Optional[Tuple[str, str, str, str, str, str, str]]:
+    """Split a COST_LOG.md table row into its stripped cells.
+
+    Returns (session, date, model, tasks, task_types, cost, notes), with the
+    leading "$" removed from cost, or None if the line is not a session row.
+    Notes is "" when the row has no closed notes cell.
+    """
+    # "| s | date | model | tasks | types | $cost |" splits into 8 parts,
+    # the first and last being the text outside the outer pipes.
+    parts = line.split("|")
+    if len(parts) < 8 or parts[0] or not parts[3]:
+        return None
+    session, date, tasks, cost = (
+        parts[1].strip(),
+        parts[2].strip(),
+        parts[4].strip(),
+        parts[6].strip(),
+    )
+    if not (session.isdecimal() and tasks.isdecimal() and _is_iso_date(date)):
+        return None
+    if len(cost) < 2 or cost[0] != "$" or cost[1:].strip(COST_DIGITS):
+        return None
+    notes = parts[7].strip() if len(parts) > 8 else ""
+    return session, date, parts[3].strip(), tasks, parts[5].strip(), cost[1:], notes
 
 
+@lru_cache(maxsize=64)
 def classify_model_tier(model_name: str) -> str:
-    """Return 'haiku', 'sonnet', or 'opus' for a model name string."""
-    if HAIKU_PATTERN.search(model_name):
+    """Return 'haiku', 'sonnet', or 'opus' for a model name string.
+
+    Cached: a cost log repeats a handful of model names across many rows.
+    """
+    name = model_name.lower()
+    if "haiku" in name:
         return "haiku"
-    if OPUS_PATTERN.search(model_name):
+    if "opus" in name:
         return "opus"
     return "sonnet"
 
 
+# Session type by task-type keyword, first match wins; "feature" otherwise.
+# Plain substring tests: row parsing compiles no regexes at all.
+SESSION_TYPE_RULES: Tuple[Tuple[str, str], ...] = (
+    ("security", "security"),
+    ("arch", "architecture"),
+    ("adr", "architecture"),
+    ("test", "testing"),
+    ("doc", "documentation"),
+)
+
+
+@lru_cache(maxsize=256)
+def classify_session_type(task_types: str) -> str:
+    """Return the session type implied by a row's task types field.
+
+    Cached: task type labels are drawn from a small vocabulary.
+    """
+    task_types_lower = task_types.lower()
+    return next(
+        (label for keyword, label in SESSION_TYPE_RULES if keyword in task_types_lower),
+        "feature",
+    )
+
+
 def parse_cost_log(repo: Path) -> List[Dict[str, Any]]:
     """Parse COST_LOG.md session table rows."""
     path = repo / "COST_LOG.md"
     if not path.is_file():
         return []
+    rows = []
+    # Logs are normally appended in session order; only sort when they aren't.
+    in_order = True
+    last_session = -1
     try:
-        content = path.read_text(encoding="utf-8")
+        # Stream the log so memory stays bounded by its longest line.
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                # Only table rows with a dollar cost can be session rows.
+                if not line.startswith("|") or "$" not in line:
+                    continue
+                fields = split_cost_row(line)
+                if fields is None:
+                    continue
+                session, date, model_raw, tasks, task_types_raw, cost, notes = fields
+                # Model names and task types repeat across rows; share one copy.
+                model_raw = sys.intern(model_raw)
+                task_types_raw = sys.intern(task_types_raw)
+                session_no = int(session)
+                if session_no < last_session:
+                    in_order = False
+                last_session = session_no
+                rows.append(
+                    {
+                        "session": session_no,
+                        "date": date,
+                        # YYYY-MM; interned so repeated months share one key
+                        "month": sys.intern(date[:7]),
+                        "model": model_raw,
+                        "tier": classify_model_tier(model_raw),
+                        "tasks": int(tasks),
+                        "task_types": task_types_raw,
+                        "session_type": classify_session_type(task_types_raw),
+                        "cost": float(cost),
+                        "notes": notes,
+                    }
+                )
     except (OSError, UnicodeDecodeError) as exc:
         print(f"Warning: Could not read {path}: {exc}", file=sys.stderr)
         return []
 
-    rows = []
-    for m in COST_TABLE_ROW_RE.finditer(content):
-        task_types_raw = m.group(5).strip()
-        notes = m.group(7).strip() if m.group(7) else ""
-
-        # Classify session type from task types field
-        task_types_lower = task_types_raw.lower()
-        if "security" in task_types_lower:
-            session_type = "security"
-        elif "arch" in task_types_lower or "adr" in task_types_lower:
-            session_type = "architecture"
-        elif "test" in task_types_lower:
-            session_type = "testing"
-        elif "docs" in task_types_lower or "doc" in task_types_lower:
-            session_type = "documentation"
-        else:
-            session_type = "feature"
-
-        model_raw = m.group(3).strip()
-        rows.append(
-            {
-                "session": int(m.group(1)),
-                "date": m.group(2),
-                "month": m.group(2)[:7],  # YYYY-MM
-                "model": model_raw,
-                "tier": classify_model_tier(model_raw),
-                "tasks": int(m.group(4)),
-                "task_types": task_types_raw,
-                "session_type": session_type,
-                "cost": float(m.group(6)),
-                "notes": notes,
-            }
-        )
-    rows.sort(key=lambda r: r["session"])
+    if not in_order:
+        rows.sort(key=itemgetter("session"))
     return rows
 
 
@@ -154,8 +225,12 @@ OPUS_TASK_KEYWORDS = {"security", "adr", "architecture", "threat", "compliance"}
 HAIKU_TASK_KEYWORDS = {"status", "read", "config", "changelog", "doc"}
 
 
+@lru_cache(maxsize=32)
 def routing_recommendation(tier: str, session_type: str) -> Tuple[str, str]:
-    """Return (recommended_tier, reason) for a given session model and type."""
+    """Return (recommended_tier, reason) for a given session model and type.
+
+    Cached: there are only a few tier and session type combinations.
+    """
     if session_type in {"security", "architecture"}:
         if tier != "opus":
             return "opus", "Security and architecture tasks need Opus reasoning depth"
@@ -167,9 +242,14 @@ def routing_recommendation(tier: str, session_type: str) -> Tuple[str, str]:
     return tier, "Correctly routed"
 
 
-def compute_routing_efficiency(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+def compute_routing_efficiency(
+    rows: List[Dict[str, Any]], agg: Optional[CostAggregate] = None
+) -> Dict[str, Any]:
     """Calculate routing efficiency: actual cost vs. optimal routing cost."""
-    actual_total = sum(r["cost"] for r in rows)
+    if agg is not None:
+        actual_total = agg.total_cost
+    else:
+        actual_total = sum(map(itemgetter("cost"), rows))
     optimal_total = 0.0
     misrouted = []
 
@@ -202,6 +282,83 @@ def compute_routing_efficiency(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+# ---------------------------------------------------------------------------
+# Row aggregation
+# ---------------------------------------------------------------------------
+
+
+# A row column to group by, or a tuple of columns for a composite key
+GroupKey = Union[str, Tuple[str, ...]]
+
+# Every grouping the full dashboard needs
+DASHBOARD_GROUPS: Tuple[GroupKey, ...] = (
+    "model",
+    "tier",
+    "session_type",
+    "month",
+    ("tier", "session_type"),
+)
+
+
+@dataclass
+class GroupTotals:
+    """Sessions, tasks and cost per group value, as parallel flat dicts.
+
+    All three dicts share the same keys in first-seen order.
+    """
+
+    sessions: Dict[Any, int] = field(default_factory=dict)
+    tasks: Dict[Any, int] = field(default_factory=dict)
+    cost: Dict[Any, float] = field(default_factory=dict)
+
+
+@dataclass
+class CostAggregate:
+    """Totals for a set of cost rows, overall and per group."""
+
+    total_cost: float
+    total_tasks: int
+    costs: List[float]
+    groups: Dict[GroupKey, GroupTotals] = field(default_factory=dict)
+
+
+def aggregate(
+    rows: List[Dict[str, Any]], groups: Tuple[GroupKey, ...] = DASHBOARD_GROUPS
+) -> CostAggregate:
+    """Total cost and tasks overall and for each requested grouping, in one pass."""
+    accumulators = [
+        (key, itemgetter(*key) if isinstance(key, tuple) else itemgetter(key))
+        for key in groups
+    ]
+    grouped = {
+        key: (defaultdict(int), defaultdict(int), defaultdict(float)) for key in groups
+    }
+    costs: List[float] = []
+    total_tasks = 0
+
+    for r in rows:
+        cost, tasks = r["cost"], r["tasks"]
+        costs.append(cost)
+        total_tasks += tasks
+        for key, get in accumulators:
+            value = get(r)
+            sessions_by, tasks_by, cost_by = grouped[key]
+            sessions_by[value] += 1
+            tasks_by[value] += tasks
+            cost_by[value] += cost
+
+    return CostAggregate(
+        # sum() rather than a running total, to match the per-section totals
+        total_cost=sum(costs),
+        total_tasks=total_tasks,
+        costs=costs,
+        groups={
+            key: GroupTotals(dict(sessions_by), dict(tasks_by), dict(cost_by))
+            for key, (sessions_by, tasks_by, cost_by) in grouped.items()
+        },
+    )
+
+
 # ---------------------------------------------------------------------------
 # Dashboard section builders
 # ---------------------------------------------------------------------------
@@ -212,16 +369,20 @@ def section_divider(title: str) -> str:
     return f"\n{line}\n## {title}\n{line}\n"
 
 
-def build_summary_section(rows: List[Dict[str, Any]]) -> str:
+def build_summary_section(
+    rows: List[Dict[str, Any]], agg: Optional[CostAggregate] = None
+) -> str:
     if not rows:
         return "_No COST_LOG.md data found. Add cost tracking to session end protocol._"
+    if agg is None:
+        agg = aggregate(rows, ())
 
-    total = sum(r["cost"] for r in rows)
+    total = agg.total_cost
     sessions = len(rows)
-    tasks = sum(r["tasks"] for r in rows)
+    tasks = agg.total_tasks
     avg_per_session = total / sessions if sessions > 0 else 0
     cost_per_task = total / tasks if tasks > 0 else 0
-    costs = [r["cost"] for r in rows]
+    costs = agg.costs
 
     lines = [
         "| Metric | Value |",
@@ -236,40 +397,34 @@ def build_summary_section(rows: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def build_model_breakdown_section(rows: List[Dict[str, Any]]) -> str:
+def build_model_breakdown_section(
+    rows: List[Dict[str, Any]], agg: Optional[CostAggregate] = None
+) -> str:
     if not rows:
         return "_No data._"
+    if agg is None:
+        agg = aggregate(rows, ("model", "tier"))
 
-    by_model: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {"sessions": 0, "tasks": 0, "cost": 0.0}
-    )
-    for r in rows:
-        by_model[r["model"]]["sessions"] += 1
-        by_model[r["model"]]["tasks"] += r["tasks"]
-        by_model[r["model"]]["cost"] += r["cost"]
-
-    total_cost = sum(r["cost"] for r in rows)
-    max_cost = max(d["cost"] for d in by_model.values()) if by_model else 1.0
+    by_model = agg.groups["model"]
+    total_cost = agg.total_cost
+    max_cost = max(by_model.cost.values()) if by_model.cost else 1.0
 
     lines = [
         "| Model | Sessions | Tasks | Total Cost | Avg/Session | % of Spend | Bar |",
         "|-------|:--------:|:-----:|:----------:|:-----------:|:----------:|-----|",
     ]
-    for model, data in sorted(by_model.items(), key=lambda x: -x[1]["cost"]):
-        avg_s = data["cost"] / data["sessions"] if data["sessions"] > 0 else 0
-        pct = data["cost"] / total_cost * 100 if total_cost > 0 else 0
-        bar = ascii_bar(data["cost"], max_cost, 10)
+    for model, cost in sorted(by_model.cost.items(), key=lambda x: -x[1]):
+        sessions = by_model.sessions[model]
+        avg_s = cost / sessions if sessions > 0 else 0
+        pct = cost / total_cost * 100 if total_cost > 0 else 0
+        bar = ascii_bar(cost, max_cost, 10)
         lines.append(
-            f"| `{model}` | {data['sessions']} | {data['tasks']} "
-            f"| ${data['cost']:.3f} | ${avg_s:.3f} | {pct:.0f}% | {bar} |"
+            f"| `{model}` | {sessions} | {by_model.tasks[model]} "
+            f"| ${cost:.3f} | ${avg_s:.3f} | {pct:.0f}% | {bar} |"
         )
 
     # Tier summary
-    by_tier: Dict[str, float] = defaultdict(float)
-    by_tier_count: Dict[str, int] = defaultdict(int)
-    for r in rows:
-        by_tier[r["tier"]] += r["cost"]
-        by_tier_count[r["tier"]] += 1
+    by_tier = agg.groups["tier"]
 
     lines += [
         "",
@@ -278,86 +433,83 @@ def build_model_breakdown_section(rows: List[Dict[str, Any]]) -> str:
         "|------|:--------:|:----------:|:----------:|",
     ]
     for tier in ["haiku", "sonnet", "opus"]:
-        if tier in by_tier:
-            pct = by_tier[tier] / total_cost * 100 if total_cost > 0 else 0
+        if tier in by_tier.cost:
+            cost = by_tier.cost[tier]
+            pct = cost / total_cost * 100 if total_cost > 0 else 0
             lines.append(
-                f"| {tier.capitalize()} | {by_tier_count[tier]} "
-                f"| ${by_tier[tier]:.3f} | {pct:.0f}% |"
+                f"| {tier.capitalize()} | {by_tier.sessions[tier]} "
+                f"| ${cost:.3f} | {pct:.0f}% |"
             )
 
     return "\n".join(lines)
 
 
-def build_session_type_section(rows: List[Dict[str, Any]]) -> str:
+def build_session_type_section(
+    rows: List[Dict[str, Any]], agg: Optional[CostAggregate] = None
+) -> str:
     if not rows:
         return "_No data._"
+    if agg is None:
+        agg = aggregate(rows, ("session_type",))
 
-    by_type: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {"sessions": 0, "tasks": 0, "cost": 0.0}
-    )
-    for r in rows:
-        by_type[r["session_type"]]["sessions"] += 1
-        by_type[r["session_type"]]["tasks"] += r["tasks"]
-        by_type[r["session_type"]]["cost"] += r["cost"]
-
-    max_cost = max(d["cost"] for d in by_type.values()) if by_type else 1.0
+    by_type = agg.groups["session_type"]
+    max_cost = max(by_type.cost.values()) if by_type.cost else 1.0
 
     lines = [
         "| Session Type | Sessions | Tasks | Total Cost | Cost/Task | Bar |",
         "|-------------|:--------:|:-----:|:----------:|:---------:|-----|",
     ]
-    for stype, data in sorted(by_type.items(), key=lambda x: -x[1]["cost"]):
-        cpt = data["cost"] / data["tasks"] if data["tasks"] > 0 else 0
-        bar = ascii_bar(data["cost"], max_cost, 10)
+    for stype, cost in sorted(by_type.cost.items(), key=lambda x: -x[1]):
+        tasks = by_type.tasks[stype]
+        cpt = cost / tasks if tasks > 0 else 0
+        bar = ascii_bar(cost, max_cost, 10)
         lines.append(
-            f"| {stype} | {data['sessions']} | {data['tasks']} "
-            f"| ${data['cost']:.3f} | ${cpt:.4f} | {bar} |"
+            f"| {stype} | {by_type.sessions[stype]} | {tasks} "
+            f"| ${cost:.3f} | ${cpt:.4f} | {bar} |"
         )
 
     return "\n".join(lines)
 
 
-def build_monthly_section(rows: List[Dict[str, Any]]) -> str:
+def build_monthly_section(
+    rows: List[Dict[str, Any]], agg: Optional[CostAggregate] = None
+) -> str:
     if not rows:
         return "_No data._"
+    if agg is None:
+        agg = aggregate(rows, ("month",))
 
-    by_month: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {"sessions": 0, "tasks": 0, "cost": 0.0, "models": set()}
-    )
-    for r in rows:
-        by_month[r["month"]]["sessions"] += 1
-        by_month[r["month"]]["tasks"] += r["tasks"]
-        by_month[r["month"]]["cost"] += r["cost"]
-        by_month[r["month"]]["models"].add(r["tier"])
-
-    months = sorted(by_month.keys())
-    monthly_costs = [by_month[m]["cost"] for m in months]
+    by_month = agg.groups["month"]
+    months = sorted(by_month.cost)
+    monthly_costs = [by_month.cost[m] for m in months]
     max_cost = max(monthly_costs) if monthly_costs else 1.0
 
     lines = [
         "| Month | Sessions | Tasks | Total Cost | Avg/Session | Avg/Task | Trend |",
         "|-------|:--------:|:-----:|:----------:|:-----------:|:--------:|-------|",
     ]
+    chart: List[str] = []
     for i, month in enumerate(months):
-        d = by_month[month]
-        avg_s = d["cost"] / d["sessions"] if d["sessions"] > 0 else 0
-        avg_t = d["cost"] / d["tasks"] if d["tasks"] > 0 else 0
-        arrow = trend_arrow(monthly_costs[: i + 1])
+        cost = monthly_costs[i]
+        sessions, tasks = by_month.sessions[month], by_month.tasks[month]
+        avg_s = cost / sessions if sessions > 0 else 0
+        avg_t = cost / tasks if tasks > 0 else 0
+        # trend_arrow only compares the last two values
+        arrow = trend_arrow(monthly_costs[max(0, i - 1) : i + 1])
         lines.append(
-            f"| {month} | {d['sessions']} | {d['tasks']} "
-            f"| ${d['cost']:.3f} | ${avg_s:.3f} | ${avg_t:.4f} | {arrow} |"
+            f"| {month} | {sessions} | {tasks} "
+            f"| ${cost:.3f} | ${avg_s:.3f} | ${avg_t:.4f} | {arrow} |"
         )
+        chart.append(f"  {month}  {ascii_bar(cost, max_cost, 20)}  ${cost:.3f}")
 
     lines += [
         "",
         "```",
         "Monthly cost trend:",
         "",
+        *chart,
+        "```",
     ]
-    for month in months:
-        bar = ascii_bar(by_month[month]["cost"], max_cost, 20)
-        lines.append(f"  {month}  {bar}  ${by_month[month]['cost']:.3f}")
-    lines.append("```")
 
     return "\n".join(lines)
 
@@ -423,66 +575,63 @@ def build_routing_efficiency_section(
     return "\n".join(lines)
 
 
-def build_recommendations_section(rows: List[Dict[str, Any]]) -> str:
+def build_recommendations_section(
+    rows: List[Dict[str, Any]], agg: Optional[CostAggregate] = None
+) -> str:
     if not rows:
         return "_No data available for recommendations._"
-
-    by_type: Dict[str, List[str]] = defaultdict(list)
-    for r in rows:
-        by_type[r["session_type"]].append(r["tier"])
+    if agg is None:
+        agg = aggregate(rows, ("tier", ("tier", "session_type")))
+    sessions_by = agg.groups[("tier", "session_type")].sessions
+    tier_counts = agg.groups["tier"].sessions
 
     lines = ["Based on your session history:\n"]
 
     # Check for tasks using Opus that could use Sonnet
-    opus_doc_sessions = [
-        r for r in rows if r["tier"] == "opus" and r["session_type"] == "documentation"
-    ]
+    opus_doc_sessions = sessions_by.get(("opus", "documentation"), 0)
     if opus_doc_sessions:
         lines += [
             "### Switch: Opus → Sonnet for Documentation",
             "",
             "Documentation sessions do not require Opus-level reasoning. "
             "Switching to Sonnet saves ~80-90% per documentation session.\n",
-            f"Affected sessions: {len(opus_doc_sessions)}",
+            f"Affected sessions: {opus_doc_sessions}",
             "",
         ]
 
     # Check for feature work on Haiku
-    haiku_feature = [
-        r for r in rows if r["tier"] == "haiku" and r["session_type"] == "feature"
-    ]
+    haiku_feature = sessions_by.get(("haiku", "feature"), 0)
     if haiku_feature:
         lines += [
             "### Upgrade: Haiku → Sonnet for Feature Work",
             "",
             "Feature implementation sessions require Sonnet-level code generation "
             "quality. Haiku may produce lower-quality output for complex features.\n",
-            f"Affected sessions: {len(haiku_feature)}",
+            f"Affected sessions: {haiku_feature}",
             "",
         ]
 
     # Check for security work on non-Opus
-    non_opus_security = [
-        r for r in rows if r["tier"] != "opus" and r["session_type"] == "security"
-    ]
+    non_opus_security = sum(
+        count
+        for (tier, stype), count in sessions_by.items()
+        if tier != "opus" and stype == "security"
+    )
     if non_opus_security:
         lines += [
             "### Upgrade: → Opus for Security Reviews",
             "",
             "Security reviews require Opus reasoning depth to catch subtle "
             "vulnerabilities. Using Sonnet or Haiku creates false confidence.\n",
-            f"Affected sessions: {len(non_opus_security)}",
+            f"Affected sessions: {non_opus_security}",
             "",
         ]
 
     # General recommendations based on tiers
-    tier_counts: Dict[str, int] = defaultdict(int)
-    for r in rows:
-        tier_counts[r["tier"]] += 1
     total = len(rows)
 
-    haiku_pct = tier_counts["haiku"] / total * 100 if total > 0 else 0
-    opus_pct = tier_counts["opus"] / total * 100 if total > 0 else 0
+    haiku_pct = tier_counts.get("haiku", 0) / total * 100 if total > 0 else 0
+    opus_pct = tier_counts.get("opus", 0) / total * 100 if total > 0 else 0
 
     lines.append("### General Routing Guidelines\n")
     lines += [
@@ -523,7 +672,8 @@ def generate_cost_dashboard(repo: Path) -> str:
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
     rows = parse_cost_log(repo)
-    efficiency = compute_routing_efficiency(rows) if rows else {}
+    agg = aggregate(rows)
+    efficiency = compute_routing_efficiency(rows, agg) if rows else {}
 
     lines = [
         "# Cost Dashboard",
@@ -537,22 +687,22 @@ def generate_cost_dashboard(repo: Path) -> str:
     ]
 
     lines.append(section_divider("Summary"))
-    lines.append(build_summary_section(rows))
+    lines.append(build_summary_section(rows, agg))
 
     lines.append(section_divider("Cost by Model"))
-    lines.append(build_model_breakdown_section(rows))
+    lines.append(build_model_breakdown_section(rows, agg))
 
     lines.append(section_divider("Cost by Session Type"))
-    lines.append(build_session_type_section(rows))
+    lines.append(build_session_type_section(rows, agg))
 
     lines.append(section_divider("Cost by Time Period"))
-    lines.append(build_monthly_section(rows))
+    lines.append(build_monthly_section(rows, agg))
 
     lines.append(section_divider("Model Routing Efficiency"))
     lines.append(build_routing_efficiency_section(rows, efficiency or {}))
 
     lines.append(section_divider("Recommendations"))
-    lines.append(build_recommendations_section(rows))
+    lines.append(build_recommendations_section(rows, agg))
 
     lines += [
         "",
@@ -618,7 +768,8 @@ def main() -> int:
         return 0
 
     output_path = repo / args.output
-    output_path.write_text(dashboard, encoding="utf-8")
+    # Encode once and write bytes: no newline translation, same file everywhere.
+    output_path.write_bytes(dashboard.encode("utf-8"))
     print(f"Cost dashboard written to {output_path}")
     return 0
 
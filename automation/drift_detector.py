@@ -10,16 +10,23 @@ Usage:
     python drift_detector.py --template templates/CLAUDE.md --target /path/to/project/CLAUDE.md
     python drift_detector.py --template templates/CLAUDE.md --target ../my-project/CLAUDE.md --format text
     python drift_detector.py --template templates/CLAUDE.md --target . --threshold 0.5
+    python drift_detector.py --template templates/CLAUDE.md --target ../a ../b --format json
 """
 
 from __future__ import annotations
 
 import argparse
+import copy
+import hashlib
 import json
+import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 
 REQUIRED_SECTIONS = [
@@ -38,6 +45,19 @@ ALIAS_GROUPS = [
 
 DEFAULT_DRIFT_THRESHOLD = 0.5
 
+# Line breaks str.splitlines() honours besides "\n"
+EXTRA_LINE_BREAKS = "\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+# Runs of whitespace and hyphens collapse to "_" in section names
+SECTION_NAME_SEP_RE = re.compile(r"[\s\-]+")
+
+# On-disk section cache (opt-in via --cache-dir). Bump the version whenever
+# the cached section data changes so stale entries are never reused.
+SECTION_CACHE_VERSION = 2
+SECTION_CACHE_MAX_ENTRIES = 4096
+
+MAX_TARGET_WORKERS = 8
+
 
 def read_file_content(file_path: Path) -> Optional[str]:
     """Read a file and return its content, or None if unreadable."""
@@ -47,6 +67,34 @@ def read_file_content(file_path: Path) -> Optional[str]:
         return None
 
 
+def _section_header(line: str) -> Optional[str]:
+    """Return the normalized section name if line is a header, else None.
+
+    A header is 1-3 "#", whitespace, then at least one more character, as
+    the former per-line header regex required. Callers check
+    line[:1] == "#" first, so most lines never get here.
+    """
+    level = 1
+    while level < 3 and line[level : level + 1] == "#":
+        level += 1
+    if len(line) > level + 1 and line[level].isspace():
+        return _collapse_separators(line[level + 1 :].strip().lower())
+    return None
+
+
+def _collapse_separators(name: str) -> str:
+    """Collapse whitespace/hyphen runs in a stripped name to "_".
+
+    Equivalent to SECTION_NAME_SEP_RE.sub("_", name). str.split() breaks on
+    the same Unicode whitespace the regex matches, so only a name with a
+    hyphen at either end, where split() would drop the separator, needs the
+    regex.
+    """
+    if name[:1] == "-" or name[-1:] == "-":
+        return SECTION_NAME_SEP_RE.sub("_", name)
+    return "_".join(name.replace("-", " ").split())
+
+
 def extract_sections(content: str) -> Dict[str, str]:
     """Extract sections keyed by ## header name (lowercased, stripped).
 
@@ -58,15 +106,15 @@ def extract_sections(content: str) -> Dict[str, str]:
     current_body: List[str] = []
 
     for line in lines:
-        match = re.match(r"^#{1,3}\s+(.+)$", line)
-        if match:
-            if current_header is not None:
-                sections[current_header] = "\n".join(current_body).strip()
-            current_header = match.group(1).strip().lower()
-            # Normalize underscores and hyphens
-            current_header = re.sub(r"[\s\-]+", "_", current_header)
-            current_body = []
-        elif current_header is not None:
+        if line[:1] == "#":
+            header = _section_header(line)
+            if header is not None:
+                if current_header is not None:
+                    sections[current_header] = "\n".join(current_body).strip()
+                current_header = header
+                current_body = []
+                continue
+        if current_header is not None:
             current_body.append(line)
 
     if current_header is not None:
@@ -75,9 +123,170 @@ def extract_sections(content: str) -> Dict[str, str]:
     return sections
 
 
+def extract_section_lengths(content: str) -> Dict[str, int]:
+    """Return {section name: body length}, as len() of extract_sections values.
+
+    Drift only compares lengths, so no per-line strings are built: the scan
+    jumps from one "#"-led line to the next with str.find and measures each
+    body as one stripped slice of content.
+    """
+    if any(ch in content for ch in EXTRA_LINE_BREAKS):
+        # splitlines() treats these as line ends too; take the line-based path
+        return _extract_section_lengths_by_line(content)
+
+    lengths: Dict[str, int] = {}
+    current_header: Optional[str] = None
+    body_start = 0
+    size = len(content)
+    if content[:1] == "#":
+        line_start = 0
+    else:
+        next_line = content.find("\n#")
+        line_start = next_line + 1 if next_line >= 0 else -1
+
+    while line_start >= 0:
+        line_end = content.find("\n", line_start)
+        if line_end < 0:
+            line_end = size
+        header = _section_header(content[line_start:line_end])
+        if header is not None:
+            if current_header is not None:
+                lengths[current_header] = len(content[body_start:line_start].strip())
+            current_header = header
+            body_start = line_end + 1
+        next_line = content.find("\n#", line_end)
+        line_start = next_line + 1 if next_line >= 0 else -1
+
+    if current_header is not None:
+        lengths[current_header] = len(content[body_start:].strip())
+
+    return lengths
+
+
+def _extract_section_lengths_by_line(content: str) -> Dict[str, int]:
+    """Line-by-line extract_section_lengths for content with unusual line breaks.
+
+    Bodies are measured while scanning instead of being joined and stripped.
+    """
+    lengths: Dict[str, int] = {}
+    current_header: Optional[str] = None
+    # Offsets into the body as "\n".join(lines) would build it
+    pos = 0
+    first_line: Optional[str] = None
+    first_pos = last_pos = 0
+    last_line = ""
+
+    def body_length() -> int:
+        if first_line is None:
+            return 0
+        start = first_pos + len(first_line) - len(first_line.lstrip())
+        return last_pos + len(last_line.rstrip()) - start
+
+    for line in content.splitlines():
+        if line[:1] == "#":
+            header = _section_header(line)
+            if header is not None:
+                if current_header is not None:
+                    lengths[current_header] = body_length()
+                current_header = header
+                pos = 0
+                first_line = None
+                continue
+        if current_header is not None:
+            if line and not line.isspace():
+                if first_line is None:
+                    first_line, first_pos = line, pos
+                last_line, last_pos = line, pos
+            pos += len(line) + 1
+
+    if current_header is not None:
+        lengths[current_header] = body_length()
+
+    return lengths
+
+
+# Entries per cache directory: listed on the first write in this process,
+# then counted up per write, so the directory is only listed again when the
+# count passes the cap and pruning is due.
+_cache_entry_counts: Dict[Path, int] = {}
+_cache_entry_counts_lock = threading.Lock()
+
+
+def _write_cache_entry(entry: Path, lengths: Dict[str, int]) -> None:
+    """Atomically write a cache entry, then prune the oldest beyond the cap."""
+    cache_dir = entry.parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Threads of one process may write the same digest concurrently
+    tmp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(lengths), encoding="utf-8")
+    os.replace(tmp, entry)
+
+    with _cache_entry_counts_lock:
+        count = _cache_entry_counts.get(cache_dir)
+        if count is None:
+            count = sum(1 for _ in cache_dir.glob("sections-*.json"))
+        else:
+            count += 1
+        if count > SECTION_CACHE_MAX_ENTRIES:
+            count = _prune_cache_dir(cache_dir)
+        _cache_entry_counts[cache_dir] = count
+
+
+def _prune_cache_dir(cache_dir: Path) -> int:
+    """Delete the oldest entries beyond the cap; return how many remain."""
+    entries = list(cache_dir.glob("sections-*.json"))
+    excess = len(entries) - SECTION_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return len(entries)
+    entries.sort(key=lambda p: p.stat().st_mtime_ns)
+    for old in entries[:excess]:
+        old.unlink(missing_ok=True)
+    return SECTION_CACHE_MAX_ENTRIES
+
+
+def extract_section_lengths_cached(
+    content: str, cache_dir: Optional[Path] = None
+) -> Dict[str, int]:
+    """Return extract_section_lengths(content), cached on disk by content hash.
+
+    Without a cache directory this is plain extract_section_lengths. The
+    cache is only an optimization: unreadable or unwritable entries fall
+    back to parsing.
+    """
+    if cache_dir is None:
+        return extract_section_lengths(content)
+
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    entry = cache_dir / f"sections-v{SECTION_CACHE_VERSION}-{digest}.json"
+    try:
+        cached = json.loads(entry.read_text(encoding="utf-8"))
+        # Entries hold section -> length; anything else is re-parsed
+        if isinstance(cached, dict) and all(type(v) is int for v in cached.values()):
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    lengths = extract_section_lengths(content)
+    try:
+        _write_cache_entry(entry, lengths)
+    except OSError:
+        pass
+    return lengths
+
+
 def normalize_section_name(name: str) -> str:
     """Normalize a section name for comparison."""
-    return re.sub(r"[\s\-]+", "_", name.lower().strip())
+    return _collapse_separators(name.lower().strip())
+
+
+# Precomputed once: (required name, normalized name) pairs, and the alias
+# group of every aliased name (first listed group wins).
+_REQUIRED_NORMALIZED = [(req, normalize_section_name(req)) for req in REQUIRED_SECTIONS]
+_REQUIRED_NORMALIZED_SET = frozenset(norm for _, norm in _REQUIRED_NORMALIZED)
+_ALIAS_LOOKUP: Dict[str, frozenset] = {}
+for _group in ALIAS_GROUPS:
+    for _name in _group:
+        _ALIAS_LOOKUP.setdefault(_name, frozenset(_group))
 
 
 def resolve_aliases(found_sections: set) -> set:
@@ -103,15 +312,26 @@ def calculate_drift(
     A section is considered drifted when the content length ratio exceeds
     the threshold (e.g., target is <50% or >200% of template length).
     """
+    return _calculate_drift_from_lengths(
+        {name: len(body) for name, body in template_sections.items()},
+        {name: len(body) for name, body in target_sections.items()},
+        threshold,
+    )
+
+
+def _calculate_drift_from_lengths(
+    template_sections: Dict[str, int],
+    target_sections: Dict[str, int],
+    threshold: float,
+) -> List[Dict[str, Any]]:
+    """calculate_drift on section lengths, as extract_section_lengths returns."""
     drifted: List[Dict[str, Any]] = []
 
-    for section_name, template_body in template_sections.items():
+    for section_name, template_len in template_sections.items():
         if section_name not in target_sections:
             continue
 
-        target_body = target_sections[section_name]
-        template_len = len(template_body)
-        target_len = len(target_body)
+        target_len = target_sections[section_name]
 
         if template_len == 0:
             continue
@@ -168,25 +388,163 @@ def generate_recommendations(
     return recommendations
 
 
+def _template_error(template_path: Path) -> Dict[str, Any]:
+    """Return the report for an unreadable template."""
+    return {
+        "error": f"Cannot read template file: {template_path}",
+        "aligned": False,
+        "missing_sections": [],
+        "drift_sections": [],
+        "recommendations": [f"Template file not found: {template_path}"],
+    }
+
+
 def detect_drift(
     template_path: Path,
     target_path: Path,
     threshold: float = DEFAULT_DRIFT_THRESHOLD,
+    cache_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
-    """Run drift detection and return a structured report."""
+    """Run drift detection and return a structured report.
+
+    When cache_dir is given, parsed sections are cached there by content
+    hash, so scanning many projects against one template parses it once.
+    Reports are also memoized in-process, keyed by both files' resolved
+    path, inode, mtime, ctime and size, so repeat calls on unchanged files
+    skip reading them. Error reports are never memoized.
+    """
     # Handle target_path being a directory
     if target_path.is_dir():
         target_path = target_path / "CLAUDE.md"
 
+    template_key = _stat_key(template_path)
+    target_key = _stat_key(target_path)
+    if template_key is None or target_key is None:
+        return detect_drift_many(template_path, [target_path], threshold, cache_dir)[0]
+    try:
+        report = _detect_drift_cached(
+            template_key, target_key, threshold, str(cache_dir) if cache_dir else None
+        )
+    except _UncachedReport as exc:
+        return exc.report
+    return copy.deepcopy(report)
+
+
+# (path as given, resolved path, inode, mtime_ns, ctime_ns, size). The path
+# as given is kept because reports echo it back; the resolved path keeps a
+# relative path used from two working directories apart.
+StatKey = Tuple[str, str, int, int, int, int]
+
+
+def _stat_key(path: Path) -> Optional[StatKey]:
+    """Return the memo key for path, or None if path cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+        resolved = str(path.resolve())
+    except OSError:
+        return None
+    return (
+        str(path),
+        resolved,
+        st.st_ino,
+        st.st_mtime_ns,
+        st.st_ctime_ns,
+        st.st_size,
+    )
+
+
+class _UncachedReport(Exception):
+    """Carries an error report out of _detect_drift_cached unmemoized.
+
+    lru_cache does not store results of calls that raise, so a failed read
+    is retried on the next call instead of being replayed.
+    """
+
+    def __init__(self, report: Dict[str, Any]) -> None:
+        super().__init__(report["error"])
+        self.report = report
+
+
+@lru_cache(maxsize=256)
+def _detect_drift_cached(
+    template_key: StatKey,
+    target_key: StatKey,
+    threshold: float,
+    cache_dir: Optional[str],
+) -> Dict[str, Any]:
+    # Any edit changes ctime (and usually mtime or size), which changes the key
+    report = detect_drift_many(
+        Path(template_key[0]),
+        [Path(target_key[0])],
+        threshold,
+        Path(cache_dir) if cache_dir else None,
+    )[0]
+    if "error" in report:
+        raise _UncachedReport(report)
+    return report
+
+
+def detect_drift_cache_stats() -> Any:
+    """Return hit/miss statistics for the in-process detect_drift cache."""
+    return _detect_drift_cached.cache_info()
+
+
+def detect_drift_cache_clear() -> None:
+    """Drop every memoized detect_drift report.
+
+    Call this in long-running processes when template or target files may
+    change without their size or mtime changing (e.g. rewritten within the
+    filesystem's timestamp resolution).
+    """
+    _detect_drift_cached.cache_clear()
+
+
+def detect_drift_many(
+    template_path: Path,
+    target_paths: List[Path],
+    threshold: float = DEFAULT_DRIFT_THRESHOLD,
+    cache_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """Run drift detection for several targets against one template.
+
+    The template is read and parsed once; targets are read and compared
+    concurrently. Reports are returned in target order.
+    """
     template_content = read_file_content(template_path)
     if template_content is None:
-        return {
-            "error": f"Cannot read template file: {template_path}",
-            "aligned": False,
-            "missing_sections": [],
-            "drift_sections": [],
-            "recommendations": [f"Template file not found: {template_path}"],
-        }
+        return [_template_error(template_path) for _ in target_paths]
+    template_sections = extract_section_lengths_cached(template_content, cache_dir)
+
+    def compare(target_path: Path) -> Dict[str, Any]:
+        return _compare_target(
+            template_path,
+            template_content,
+            template_sections,
+            target_path,
+            threshold,
+            cache_dir,
+        )
+
+    if len(target_paths) <= 1:
+        return [compare(target) for target in target_paths]
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_TARGET_WORKERS, len(target_paths))
+    ) as executor:
+        return list(executor.map(compare, target_paths))
+
+
+def _compare_target(
+    template_path: Path,
+    template_content: str,
+    template_sections: Dict[str, int],
+    target_path: Path,
+    threshold: float,
+    cache_dir: Optional[Path],
+) -> Dict[str, Any]:
+    """Build the drift report for one target against a parsed template."""
+    # Handle target_path being a directory
+    if target_path.is_dir():
+        target_path = target_path / "CLAUDE.md"
 
     target_content = read_file_content(target_path)
     if target_content is None:
@@ -201,44 +559,41 @@ def detect_drift(
             ],
         }
 
-    template_sections = extract_sections(template_content)
-    target_sections = extract_sections(target_content)
+    # A freshly bootstrapped project often still has the template verbatim
+    identical = target_content == template_content
+    if identical:
+        target_sections = template_sections
+    else:
+        target_sections = extract_section_lengths_cached(target_content, cache_dir)
 
     # Determine which required sections are missing
     found_normalized = set(target_sections.keys())
     resolved = resolve_aliases(found_normalized)
 
-    missing: List[str] = []
-    for req in REQUIRED_SECTIONS:
-        normalized = normalize_section_name(req)
-        if normalized not in resolved:
-            # Skip alias partners if one is already found
-            skip = False
-            for group in ALIAS_GROUPS:
-                if normalized in group and group & resolved:
-                    skip = True
-                    break
-            if not skip:
-                missing.append(req)
-
-    # Deduplicate: if both aliases are missing, only report one
-    seen_groups: List[set] = []
+    # Set difference finds the missing names; the ordered pass then reports
+    # each once, and a missing alias group once as "a or b". A group with
+    # any member found is already fully in resolved, so it never gets here.
     deduped_missing: List[str] = []
-    for m in missing:
-        norm = normalize_section_name(m)
-        in_group = False
-        for group in ALIAS_GROUPS:
-            if norm in group:
-                if group not in seen_groups:
-                    seen_groups.append(group)
-                    deduped_missing.append(" or ".join(sorted(group)))
-                in_group = True
-                break
-        if not in_group:
-            deduped_missing.append(m)
-
-    # Detect content drift
-    drift_sections = calculate_drift(template_sections, target_sections, threshold)
+    missing_norms = _REQUIRED_NORMALIZED_SET - resolved
+    if missing_norms:
+        reported_groups: Set[frozenset] = set()
+        for req, normalized in _REQUIRED_NORMALIZED:
+            if normalized not in missing_norms:
+                continue
+            group = _ALIAS_LOOKUP.get(normalized)
+            if group is None:
+                deduped_missing.append(req)
+            elif group not in reported_groups:
+                reported_groups.add(group)
+                deduped_missing.append(" or ".join(sorted(group)))
+
+    # Detect content drift; identical files have a length ratio of 1 everywhere
+    if identical and threshold >= 0:
+        drift_sections: List[Dict[str, Any]] = []
+    else:
+        drift_sections = _calculate_drift_from_lengths(
+            template_sections, target_sections, threshold
+        )
 
     aligned = len(deduped_missing) == 0 and len(drift_sections) == 0
     recommendations = generate_recommendations(deduped_missing, drift_sections)
@@ -316,8 +671,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--target",
         type=Path,
+        nargs="+",
         required=True,
-        help="Path to the project CLAUDE.md (or directory containing it)",
+        help=(
+            "Path to the project CLAUDE.md (or directory containing it); "
+            "several targets are checked against the same template"
+        ),
     )
     parser.add_argument(
         "--threshold",
@@ -335,6 +694,15 @@ def build_parser() -> argparse.ArgumentParser:
         dest="output_format",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Cache parsed sections in this directory, e.g. .governance-cache "
+            "(default: no cache)"
+        ),
+    )
     return parser
 
 
@@ -343,18 +711,22 @@ def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
 
-    report = detect_drift(
+    reports = detect_drift_many(
         template_path=args.template,
-        target_path=args.target,
+        target_paths=args.target,
         threshold=args.threshold,
+        cache_dir=args.cache_dir,
     )
 
     if args.output_format == "json":
-        print(format_json(report))
+        if len(reports) == 1:
+            print(format_json(reports[0]))
+        else:
+            print(json.dumps(reports, indent=2))
     else:
-        print(format_text(report))
+        print("\n\n".join(format_text(report) for report in reports))
 
-    return 0 if report.get("aligned", False) else 1
+    return 0 if all(report.get("aligned", False) for report in reports) else 1
 
 
 if __name__ == "__main__":
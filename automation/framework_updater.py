@@ -16,28 +16,51 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import socket
 import sys
+import time
 import urllib.error
 import urllib.request
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 GITHUB_OWNER = "clauseduardpetraeus"
 GITHUB_REPO = "ai-governance-framework"
 GITHUB_API_BASE = "https://api.github.com"
 VERSION_FILE = ".governance-version"
 DEFAULT_VERSION = "v1.0.0"
+RELEASES_CACHE_FILE = "releases.json"
+RELEASE_NOTES_EXCERPT = 300
+# Release fields read by the report formatters; the rest of the API payload
+# is dropped as each page is parsed
+RELEASE_FIELDS = ("tag_name", "published_at", "body", "html_url", "assets")
+ASSET_FIELDS = ("name", "size")
 
+# Transient GitHub API failures are retried with exponential backoff
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.3
+MAX_RETRY_DELAY_SECONDS = 10.0
 
+SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)")
+PRERELEASE_RE = re.compile(r"^\d+\.\d+\.\d+-")
+NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+@lru_cache(maxsize=4096)
 def parse_version(version_string: str) -> Tuple[int, int, int]:
     """Parse a semantic version string into a (major, minor, patch) tuple.
 
     Accepts versions with or without a leading 'v', e.g. 'v1.2.3' or '1.2.3'.
+    Cached: each tag is parsed while filtering, again as a sort key, and
+    again when looking for updates.
     """
     cleaned = version_string.strip().lstrip("v")
-    match = re.match(r"^(\d+)\.(\d+)\.(\d+)", cleaned)
+    match = SEMVER_RE.match(cleaned)
     if not match:
         raise ValueError(f"Invalid semantic version: {version_string!r}")
     return int(match.group(1)), int(match.group(2)), int(match.group(3))
@@ -47,7 +70,7 @@ def _parse_next_link(link_header: str) -> Optional[str]:
     """Extract the 'next' page URL from a GitHub Link response header."""
     if not link_header:
         return None
-    match = re.search(r'<([^>]+)>;\s*rel="next"', link_header)
+    match = NEXT_LINK_RE.search(link_header)
     return match.group(1) if match else None
 
 
@@ -80,40 +103,184 @@ def read_local_version(repo_path: Path) -> str:
     return text
 
 
-def fetch_releases(owner: str = GITHUB_OWNER, repo: str = GITHUB_REPO) -> List[Dict]:
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for release data."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ai-governance-framework"
+
+
+def _valid_cached_page(page: Any) -> bool:
+    """Return True if page has the shape fetch_releases stores and reads."""
+    return (
+        isinstance(page, dict)
+        and isinstance(page.get("data"), list)
+        and all(isinstance(release, dict) for release in page["data"])
+        and isinstance(page.get("etag", ""), str)
+        and isinstance(page.get("last_modified", ""), str)
+        and isinstance(page.get("next"), (str, type(None)))
+    )
+
+
+def _load_release_cache(cache_file: Path) -> Dict[str, Dict[str, Any]]:
+    """Load cached release pages keyed by URL, or {} if missing or corrupt.
+
+    Malformed page entries are dropped, so their URLs are fetched in full.
+    """
+    try:
+        pages = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(pages, dict):
+        return {}
+    return {url: page for url, page in pages.items() if _valid_cached_page(page)}
+
+
+def _save_release_cache(cache_file: Path, pages: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically write cached release pages; a failure only costs the cache."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(pages), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError as exc:
+        print(f"Warning: Could not write {cache_file}: {exc}", file=sys.stderr)
+
+
+def _urlopen_with_retry(req: urllib.request.Request) -> Any:
+    """Open req, retrying rate-limit and server errors with backoff.
+
+    Honours a numeric Retry-After header, capped at MAX_RETRY_DELAY_SECONDS.
+    Other HTTP errors (including 304 Not Modified) are raised at once, and
+    the final attempt raises whatever it gets.
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            return urllib.request.urlopen(req, timeout=15)
+        except urllib.error.HTTPError as exc:
+            if exc.code not in RETRY_STATUS_CODES:
+                raise
+            delay = RETRY_BACKOFF_SECONDS * 2**attempt
+            retry_after = exc.headers.get("Retry-After", "") if exc.headers else ""
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            # Release the error response's connection before waiting
+            exc.close()
+        time.sleep(min(delay, MAX_RETRY_DELAY_SECONDS))
+    return urllib.request.urlopen(req, timeout=15)
+
+
+def _slim_release(release: Dict) -> Dict:
+    """Keep only the fields the report uses, with release notes cut short.
+
+    One character past the excerpt is kept so format_text can still tell
+    that the notes were longer and append "...".
+    """
+    slim = {key: release[key] for key in RELEASE_FIELDS if key in release}
+    body = slim.get("body")
+    if body and len(body) > RELEASE_NOTES_EXCERPT + 1:
+        slim["body"] = body[: RELEASE_NOTES_EXCERPT + 1]
+    assets = slim.get("assets")
+    if assets:
+        slim["assets"] = [
+            {key: asset[key] for key in ASSET_FIELDS if key in asset}
+            for asset in assets
+        ]
+    return slim
+
+
+def _page_reaches(page_data: List[Dict], version: Tuple[int, int, int]) -> bool:
+    """Return True if the page holds a release tag at or below version."""
+    for release in page_data:
+        try:
+            if parse_version(release.get("tag_name", "")) <= version:
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def fetch_releases(
+    owner: str = GITHUB_OWNER,
+    repo: str = GITHUB_REPO,
+    cache_dir: Optional[Path] = None,
+    newer_than: Optional[str] = None,
+) -> List[Dict]:
     """Fetch all releases from the GitHub API with pagination, sorted by semantic version.
 
     Pre-releases (e.g. v1.2.3-beta) are logged and skipped.
     Pagination via Link header is followed automatically.
+
+    With a cache_dir, each page is stored with its ETag and revalidated with
+    If-None-Match (or If-Modified-Since when the response carried only a
+    Last-Modified date); an unchanged page comes back as 304 Not Modified,
+    which costs no body transfer and no rate limit quota.
+
+    GitHub lists releases newest first, so with newer_than set pagination
+    stops after the first page that reaches a release at or below that
+    version: later pages only hold older releases.
     """
+    stop_at = parse_version(newer_than) if newer_than is not None else None
     url: Optional[str] = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases?per_page=100"
     headers = {"Accept": "application/vnd.github+json"}
     all_releases: List[Dict] = []
+    cache_file = cache_dir / RELEASES_CACHE_FILE if cache_dir is not None else None
+    cached_pages = _load_release_cache(cache_file) if cache_file else {}
+    pages: Dict[str, Dict[str, Any]] = {}
 
     while url:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=15) as response:
-            page_data = json.loads(response.read().decode("utf-8"))
-            all_releases.extend(page_data)
-            link_header = response.headers.get("Link", "")
-            url = _parse_next_link(link_header)
-
-    valid: List[Dict] = []
+        cached = cached_pages.get(url)
+        page_headers = dict(headers)
+        if cached and cached.get("etag"):
+            page_headers["If-None-Match"] = cached["etag"]
+        elif cached and cached.get("last_modified"):
+            page_headers["If-Modified-Since"] = cached["last_modified"]
+        req = urllib.request.Request(url, headers=page_headers)
+        try:
+            with _urlopen_with_retry(req) as response:
+                page_data = [_slim_release(r) for r in json.loads(response.read())]
+                link_header = response.headers.get("Link", "")
+                next_url = _parse_next_link(link_header)
+                etag = response.headers.get("ETag", "")
+                last_modified = response.headers.get("Last-Modified", "")
+        except urllib.error.HTTPError as exc:
+            if exc.code != 304 or not cached:
+                raise
+            # The 304 carries an open (empty) response; release it
+            exc.close()
+            page_data = cached["data"]
+            next_url = cached.get("next")
+            etag = cached.get("etag", "")
+            last_modified = cached.get("last_modified", "")
+        all_releases.extend(page_data)
+        pages[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "next": next_url,
+            "data": page_data,
+        }
+        if stop_at is not None and _page_reaches(page_data, stop_at):
+            break
+        url = next_url
+
+    if cache_file is not None and pages != cached_pages:
+        _save_release_cache(cache_file, pages)
+
+    # Keep each parsed version next to its release so sorting reuses it
+    keyed: List[Tuple[Tuple[int, int, int], Dict]] = []
     for release in all_releases:
         tag = release.get("tag_name", "")
         cleaned = tag.lstrip("v")
         # Skip pre-releases (e.g. v1.2.3-beta, v2.0.0-rc1)
-        if re.match(r"^\d+\.\d+\.\d+-", cleaned):
+        if PRERELEASE_RE.match(cleaned):
             print(f"Warning: Skipping pre-release tag: {tag}", file=sys.stderr)
             continue
         try:
-            parse_version(tag)
-            valid.append(release)
+            keyed.append((parse_version(tag), release))
         except ValueError:
             continue
 
-    valid.sort(key=lambda r: parse_version(r["tag_name"]))
-    return valid
+    keyed.sort(key=itemgetter(0))
+    return [release for _, release in keyed]
 
 
 def get_available_updates(releases: List[Dict], current_version: str) -> List[Dict]:
@@ -153,8 +320,8 @@ def format_text(
             release.get("body", "No release notes available.")
             or "No release notes available."
         )
-        excerpt = body[:300]
-        if len(body) > 300:
+        excerpt = body[:RELEASE_NOTES_EXCERPT]
+        if len(body) > RELEASE_NOTES_EXCERPT:
             excerpt += "..."
         lines.append(f"{tag} ({published}):")
         lines.append(f"  Release notes: {excerpt}")
@@ -177,7 +344,7 @@ def format_json(current_version: str, latest_version: str, updates: List[Dict])
             {
                 "version": r["tag_name"],
                 "published_at": r.get("published_at", ""),
-                "release_notes": (r.get("body", "") or "")[:300],
+                "release_notes": (r.get("body", "") or "")[:RELEASE_NOTES_EXCERPT],
                 "html_url": r.get("html_url", ""),
             }
             for r in updates
@@ -217,12 +384,13 @@ def run(
     check_only: bool = False,
     output_format: str = "text",
     apply: bool = False,
+    cache_dir: Optional[Path] = None,
 ) -> int:
     """Run the framework updater and return an exit code (0 = success)."""
     current_version = read_local_version(repo_path)
 
     try:
-        releases = fetch_releases()
+        releases = fetch_releases(cache_dir=cache_dir, newer_than=current_version)
     except urllib.error.HTTPError as exc:
         print(f"Error: GitHub API returned an error: {exc}", file=sys.stderr)
         return 1
@@ -281,6 +449,20 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show what files would be added or updated (does not apply changes)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory for cached release data "
+            "(default: $XDG_CACHE_HOME/ai-governance-framework or ~/.cache/...)"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download releases, without reading or writing the cache",
+    )
     return parser
 
 
@@ -292,5 +474,6 @@ if __name__ == "__main__":
         check_only=args.check_only,
         output_format=args.output_format,
         apply=args.apply,
+        cache_dir=None if args.no_cache else args.cache_dir or default_cache_dir(),
     )
     sys.exit(exit_code)
@@ -4,12 +4,11 @@ Covers: keyword extraction, decision parsing (CHANGELOG and DECISIONS.md),
 ADR loading, coverage checking, and the run() entry point.
 """
 
+import json
 from pathlib import Path
 
-
 import adr_coverage_checker as acc
 
-
 # ---------------------------------------------------------------------------
 # extract_keywords
 # ---------------------------------------------------------------------------
@@ -164,6 +163,36 @@ class TestCheckCoverage:
     def test_no_decisions_no_results(self):
         assert acc.check_coverage([], []) == []
 
+    def test_covering_adrs_listed_in_adr_order(self):
+        decision = acc.Decision(
+            source="DECISIONS.md",
+            identifier="DEC-001",
+            title="Use PostgreSQL for storage",
+            body="Chosen for ACID compliance and relational queries.",
+        )
+        adrs = [
+            acc.Adr(
+                path="ADR-001.md",
+                number="001",
+                title="Use PostgreSQL for storage",
+                content="Relational queries with ACID compliance.",
+            ),
+            acc.Adr(
+                path="ADR-002.md",
+                number="002",
+                title="Choose a message broker",
+                content="Kafka selected for event streaming.",
+            ),
+            acc.Adr(
+                path="ADR-003.md",
+                number="003",
+                title="PostgreSQL replication",
+                content="Streaming replication for relational storage.",
+            ),
+        ]
+        results = acc.check_coverage([decision], adrs)
+        assert results[0].covering_adrs == ["001", "003"]
+
 
 # ---------------------------------------------------------------------------
 # run — exit codes
@@ -175,6 +204,23 @@ class TestRun:
         exit_code = acc.run(tmp_path, threshold="strict", output_format="json")
         assert exit_code == 0
 
+    def test_changelog_duplicate_of_decisions_md_is_dropped(self, tmp_path, capsys):
+        (tmp_path / "DECISIONS.md").write_text(
+            "## DEC-001 -- Deploy On Kubernetes -- 2025-01-01\n\n"
+            "We deploy each service independently with Docker and Kubernetes.\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "CHANGELOG.md").write_text(
+            "## Session 001 -- 2025-01-01\n\n"
+            "### Decisions made\n\n"
+            "- **deploy on kubernetes**: Services are deployed independently on a cluster.\n",
+            encoding="utf-8",
+        )
+        acc.run(tmp_path, threshold="warn", output_format="json")
+        output = json.loads(capsys.readouterr().out)
+        assert output["decisions_found"] == 1
+        assert output["uncovered_decisions"][0]["identifier"] == "DEC-001"
+
     def test_warn_threshold_exits_zero_even_with_uncovered(self, tmp_path):
         (tmp_path / "DECISIONS.md").write_text(
             "## DEC-001 -- Deploy microservices -- 2025-01-01\n\n"
@@ -250,6 +296,20 @@ class TestParseChangelogDecisions:
         decisions = acc.parse_changelog_decisions(tmp_path / "CHANGELOG.md")
         assert decisions == []
 
+    def test_inline_heading_ends_bullet_and_section(self, tmp_path):
+        """Test that a ### after a bullet's text closes the decisions section."""
+        (tmp_path / "CHANGELOG.md").write_text(
+            "## Session 001 -- 2025-01-01\n\n"
+            "### Decisions made\n\n"
+            "- **Use PostgreSQL**: Chosen for relational storage needs. ### Notes\n"
+            "- **Deploy on AWS**: AWS was selected for cloud infrastructure hosting.\n",
+            encoding="utf-8",
+        )
+        decisions = acc.parse_changelog_decisions(tmp_path / "CHANGELOG.md")
+        assert [(d.title, d.body) for d in decisions] == [
+            ("Use PostgreSQL", "Chosen for relational storage needs.")
+        ]
+
     def test_session_without_decisions_section(self, tmp_path):
         """Test that sessions without 'Decisions made' are skipped."""
         (tmp_path / "CHANGELOG.md").write_text(
@@ -288,6 +348,21 @@ class TestParseChangelogDecisions:
         decisions = acc.parse_changelog_decisions(tmp_path / "CHANGELOG.md")
         assert len(decisions) == 2
 
+    def test_bullets_outside_decisions_section_ignored(self, tmp_path):
+        """Test that bullets before or after the 'Decisions made' section are ignored."""
+        (tmp_path / "CHANGELOG.md").write_text(
+            "## Session 001 -- 2025-01-01\n\n"
+            "### Tasks completed\n\n"
+            "- **Wrote the parser**: Implemented the single-pass changelog parser today.\n\n"
+            "### Decisions made\n\n"
+            "- **Use PostgreSQL**: We chose PostgreSQL for relational storage and ACID compliance.\n\n"
+            "### Next session\n\n"
+            "- **Review the parser**: Someone should review the parser before release.\n",
+            encoding="utf-8",
+        )
+        decisions = acc.parse_changelog_decisions(tmp_path / "CHANGELOG.md")
+        assert [d.identifier for d in decisions] == ["Session 001 — Use PostgreSQL"]
+
 
 # ---------------------------------------------------------------------------
 # load_adrs — fallback title
@@ -321,6 +396,21 @@ class TestLoadAdrsExtended:
         assert len(adrs) == 1
         assert adrs[0].title == "ADR-002-no-heading"
 
+    def test_unreadable_adr_is_skipped_with_warning(self, tmp_path, capsys):
+        """Test that an ADR that cannot be decoded is skipped and the rest load in order."""
+        adr_dir = tmp_path / "docs" / "adr"
+        adr_dir.mkdir(parents=True)
+        (adr_dir / "ADR-001-first.md").write_text(
+            "# ADR-001: First\n", encoding="utf-8"
+        )
+        (adr_dir / "ADR-002-broken.md").write_bytes(b"# ADR-002: \xff\xfe broken\n")
+        (adr_dir / "ADR-003-third.md").write_text(
+            "# ADR-003: Third\n", encoding="utf-8"
+        )
+        adrs = acc.load_adrs(adr_dir)
+        assert [a.number for a in adrs] == ["001", "003"]
+        assert "ADR-002-broken.md" in capsys.readouterr().err
+
 
 # ---------------------------------------------------------------------------
 # format_text
@@ -404,6 +494,58 @@ class TestCheckCoverageExtended:
         assert results[0].covered is True
         assert "001" in results[0].covering_adrs
 
+    def test_explicit_reference_must_match_full_number(self):
+        """Test that ADR-0012 does not count as a reference to ADR-001."""
+        decision = acc.Decision(
+            source="DECISIONS.md",
+            identifier="DEC-002",
+            title="Unique title xyz",
+            body="See ADR-0012 and adr 002 for the background.",
+        )
+        adrs = [
+            acc.Adr(path="ADR-001.md", number="001", title="Alpha", content="First."),
+            acc.Adr(path="ADR-002.md", number="002", title="Beta", content="Second."),
+        ]
+        results = acc.check_coverage([decision], adrs)
+        assert results[0].covering_adrs == ["002"]
+
+    def test_explicit_reference_takes_precedence_over_keywords(self):
+        """Test that an explicit ADR reference short-circuits keyword matching."""
+        decision = acc.Decision(
+            source="DECISIONS.md",
+            identifier="DEC-003",
+            title="Use PostgreSQL for storage",
+            body="Relational queries and ACID compliance, recorded in ADR-002.",
+        )
+        adrs = [
+            acc.Adr(
+                path="ADR-001.md",
+                number="001",
+                title="Use PostgreSQL for storage",
+                content="Relational queries with ACID compliance.",
+            ),
+            acc.Adr(path="ADR-002.md", number="002", title="Beta", content="Second."),
+        ]
+        results = acc.check_coverage([decision], adrs)
+        assert results[0].covering_adrs == ["002"]
+
+    def test_reference_to_missing_adr_falls_back_to_keywords(self):
+        """Test that citing a non-existent ADR still allows keyword coverage."""
+        decision = acc.Decision(
+            source="DECISIONS.md",
+            identifier="DEC-004",
+            title="Use PostgreSQL for storage",
+            body="Relational queries and ACID compliance, see ADR-099.",
+        )
+        adr = acc.Adr(
+            path="ADR-001.md",
+            number="001",
+            title="Use PostgreSQL for storage",
+            content="Relational queries with ACID compliance.",
+        )
+        results = acc.check_coverage([decision], [adr])
+        assert results[0].covering_adrs == ["001"]
+
 
 # ---------------------------------------------------------------------------
 # build_parser
@@ -2,14 +2,16 @@
 
 Tests pure functions (calculate_relevance, parse_rss_date, scan_sources)
 without making real network calls. Network-dependent functions are tested
-with mocked _http_get responses.
+with mocked _http_get / _http_open responses.
 """
 
+import io
 import json
 import urllib.error
 from datetime import datetime, timezone
 from unittest.mock import patch
 
+import pytest
 
 import best_practice_scanner as bps
 
@@ -50,6 +52,11 @@ class TestCalculateRelevance:
         score_upper = bps.calculate_relevance("AI GOVERNANCE BEST PRACTICES", keywords)
         assert score_lower == score_upper
 
+    def test_score_saturates_at_one(self):
+        keywords = ["AI governance", "agent safety", "LLM", "unmatched phrase"]
+        score = bps.calculate_relevance("AI governance and agent safety", keywords)
+        assert score == 1.0
+
 
 # ---------------------------------------------------------------------------
 # parse_rss_date
@@ -72,9 +79,32 @@ class TestParseRssDate:
         assert dt is not None
         assert dt.year == 2025
 
+    def test_iso8601_offset_is_preserved(self):
+        dt = bps.parse_rss_date("2025-03-15T10:30:00+02:00")
+        assert dt is not None
+        assert dt.utcoffset().total_seconds() == 7200
+
+    def test_rfc822_named_zone_is_utc(self):
+        dt = bps.parse_rss_date("Thu, 13 Feb 2025 08:00:00 GMT")
+        assert dt is not None
+        assert dt.tzinfo is not None
+        assert dt.day == 13
+
     def test_invalid_format_returns_none(self):
         assert bps.parse_rss_date("not a date at all") is None
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2025-03-15T10:30:00.123+00:00",
+            "2025-03-15T10:30",
+            "20250315",
+            "2025-W11-6",
+        ],
+    )
+    def test_iso_variants_outside_the_format_list_rejected(self, value):
+        assert bps.parse_rss_date(value) is None
+
     def test_result_is_timezone_aware(self):
         dt = bps.parse_rss_date("2025-01-01")
         assert dt is not None
@@ -124,9 +154,9 @@ class TestScanSourcesWithMock:
         assert sorted_findings[0]["relevance_score"] == 0.9
         assert sorted_findings[-1]["relevance_score"] == 0.1
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_source_fetch_failure_returns_empty(self, mock_http_get):
-        mock_http_get.side_effect = urllib.error.URLError("Network error")
+    @patch("best_practice_scanner._http_open")
+    def test_rss_source_fetch_failure_returns_empty(self, mock_http_open):
+        mock_http_open.side_effect = urllib.error.URLError("Network error")
         source = {"name": "Test RSS", "url": "https://example.com/feed", "type": "rss"}
         cutoff = datetime(2025, 1, 1, tzinfo=timezone.utc)
         results = bps.fetch_rss(source, cutoff, bps.DEFAULT_KEYWORDS)
@@ -154,8 +184,8 @@ class TestScanSourcesWithMock:
 class TestFetchRss:
     """Tests for the fetch_rss function covering XML parsing branches."""
 
-    @patch("best_practice_scanner._http_get")
-    def test_successful_rss_parse_returns_findings(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_successful_rss_parse_returns_findings(self, mock_http_open):
         """Test that a valid RSS XML response is parsed into a findings list.
 
         Note: ElementTree's Element.__bool__ returns False for childless elements,
@@ -173,7 +203,7 @@ class TestFetchRss:
             "</item>"
             "</channel></rss>"
         )
-        mock_http_get.return_value = rss_xml
+        mock_http_open.return_value = io.BytesIO(rss_xml.encode("utf-8"))
 
         source = {"name": "Test Feed", "url": "https://example.com/feed", "type": "rss"}
         cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -183,8 +213,8 @@ class TestFetchRss:
         assert "AI governance" in results[0]["title"]
         assert results[0]["date"] != ""
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_item_before_cutoff_is_skipped(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_rss_item_before_cutoff_is_skipped(self, mock_http_open):
         """Test that RSS items with pubDate before the cutoff are excluded.
 
         Uses a <sub/> child to make the pubDate element truthy for Element.__bool__.
@@ -199,27 +229,44 @@ class TestFetchRss:
             "</item>"
             "</channel></rss>"
         )
-        mock_http_get.return_value = rss_xml
+        mock_http_open.return_value = io.BytesIO(rss_xml.encode("utf-8"))
 
         source = {"name": "Test Feed", "url": "https://example.com/feed", "type": "rss"}
         cutoff = datetime(2025, 1, 1, tzinfo=timezone.utc)
         results = bps.fetch_rss(source, cutoff, bps.DEFAULT_KEYWORDS)
         assert results == []
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_invalid_xml_returns_empty(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_multiple_rss_items_are_streamed_in_order(self, mock_http_open):
+        """Test that every item in a streamed feed becomes a finding, in order."""
+        rss_xml = (
+            "<rss><channel>"
+            "<item><title>First<sub/></title></item>"
+            "<item><title>Second<sub/></title></item>"
+            "<item><title>Third<sub/></title></item>"
+            "</channel></rss>"
+        )
+        mock_http_open.return_value = io.BytesIO(rss_xml.encode("utf-8"))
+
+        source = {"name": "Test", "url": "https://example.com/feed", "type": "rss"}
+        cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        results = bps.fetch_rss(source, cutoff, bps.DEFAULT_KEYWORDS)
+        assert [r["title"] for r in results] == ["First", "Second", "Third"]
+
+    @patch("best_practice_scanner._http_open")
+    def test_rss_invalid_xml_returns_empty(self, mock_http_open):
         """Test that invalid XML gracefully returns empty list."""
-        mock_http_get.return_value = "not valid xml <><><>"
+        mock_http_open.return_value = io.BytesIO(b"not valid xml <><><>")
 
         source = {"name": "Bad Feed", "url": "https://example.com/bad", "type": "rss"}
         cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
         results = bps.fetch_rss(source, cutoff, bps.DEFAULT_KEYWORDS)
         assert results == []
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_http_error_returns_empty(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_rss_http_error_returns_empty(self, mock_http_open):
         """Test that HTTP errors from urlopen return empty list."""
-        mock_http_get.side_effect = urllib.error.HTTPError(
+        mock_http_open.side_effect = urllib.error.HTTPError(
             "https://example.com/err", 404, "Not Found", {}, None
         )
 
@@ -228,8 +275,24 @@ class TestFetchRss:
         results = bps.fetch_rss(source, cutoff, bps.DEFAULT_KEYWORDS)
         assert results == []
 
-    @patch("best_practice_scanner._http_get")
-    def test_atom_feed_is_parsed(self, mock_http_get):
+    @pytest.mark.parametrize("error", [TimeoutError, ConnectionResetError])
+    @patch("best_practice_scanner._http_open")
+    def test_rss_error_while_streaming_returns_empty(self, mock_http_open, error):
+        """Test that a connection failing mid-read returns empty list."""
+
+        def read(*_args):
+            raise error("read failed")
+
+        response = io.BytesIO()
+        response.read = read
+        mock_http_open.return_value = response
+
+        source = {"name": "Slow Feed", "url": "https://example.com/slow", "type": "rss"}
+        cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        assert bps.fetch_rss(source, cutoff, bps.DEFAULT_KEYWORDS) == []
+
+    @patch("best_practice_scanner._http_open")
+    def test_atom_feed_is_parsed(self, mock_http_open):
         """Test that Atom format feeds are also parsed correctly.
 
         Uses child elements to make Elements truthy (ElementTree gotcha).
@@ -244,7 +307,7 @@ class TestFetchRss:
             "</entry>"
             "</feed>"
         )
-        mock_http_get.return_value = atom_xml
+        mock_http_open.return_value = io.BytesIO(atom_xml.encode("utf-8"))
 
         source = {"name": "Atom Feed", "url": "https://example.com/atom", "type": "rss"}
         cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -252,8 +315,8 @@ class TestFetchRss:
         assert len(results) == 1
         assert results[0]["url"] == "https://example.com/atom-article"
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_item_without_date_is_included(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_rss_item_without_date_is_included(self, mock_http_open):
         """Test that items without a parsable date element are still included."""
         rss_xml = (
             "<rss><channel>"
@@ -264,7 +327,7 @@ class TestFetchRss:
             "</item>"
             "</channel></rss>"
         )
-        mock_http_get.return_value = rss_xml
+        mock_http_open.return_value = io.BytesIO(rss_xml.encode("utf-8"))
 
         source = {"name": "Test", "url": "https://example.com/feed", "type": "rss"}
         cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -272,8 +335,8 @@ class TestFetchRss:
         assert len(results) == 1
         assert results[0]["date"] == ""
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_item_with_link_href_attribute(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_rss_item_with_link_href_attribute(self, mock_http_open):
         """Test that link elements with href attribute are correctly extracted."""
         rss_xml = (
             "<rss><channel>"
@@ -284,7 +347,7 @@ class TestFetchRss:
             "</item>"
             "</channel></rss>"
         )
-        mock_http_get.return_value = rss_xml
+        mock_http_open.return_value = io.BytesIO(rss_xml.encode("utf-8"))
 
         source = {"name": "Test", "url": "https://example.com/feed", "type": "rss"}
         cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -292,8 +355,8 @@ class TestFetchRss:
         assert len(results) == 1
         assert results[0]["url"] == "https://example.com/href-link"
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_item_no_link_element(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_rss_item_no_link_element(self, mock_http_open):
         """Test that items without a link element get empty URL."""
         rss_xml = (
             "<rss><channel>"
@@ -303,7 +366,7 @@ class TestFetchRss:
             "</item>"
             "</channel></rss>"
         )
-        mock_http_get.return_value = rss_xml
+        mock_http_open.return_value = io.BytesIO(rss_xml.encode("utf-8"))
 
         source = {"name": "Test", "url": "https://example.com/feed", "type": "rss"}
         cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -311,8 +374,8 @@ class TestFetchRss:
         assert len(results) == 1
         assert results[0]["url"] == ""
 
-    @patch("best_practice_scanner._http_get")
-    def test_rss_item_no_title_element(self, mock_http_get):
+    @patch("best_practice_scanner._http_open")
+    def test_rss_item_no_title_element(self, mock_http_open):
         """Test that items without title get 'Untitled'."""
         rss_xml = (
             "<rss><channel>"
@@ -322,7 +385,7 @@ class TestFetchRss:
             "</item>"
             "</channel></rss>"
         )
-        mock_http_get.return_value = rss_xml
+        mock_http_open.return_value = io.BytesIO(rss_xml.encode("utf-8"))
 
         source = {"name": "Test", "url": "https://example.com/feed", "type": "rss"}
         cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -427,6 +490,29 @@ class TestFetchWeb:
         assert results[0]["source"] == "Web Page"
         assert "var x = 1" not in results[0]["excerpt"]
 
+    @patch("best_practice_scanner._http_get")
+    def test_web_fetch_collapses_markup_and_whitespace(self, mock_http_get):
+        """Test that tags, style blocks, and whitespace runs collapse to single spaces."""
+        mock_http_get.return_value = (
+            "<div>\n  <p>AI   governance</p>\n<style>p { margin: 0; }</style>"
+            "<span>matters</span>\n</div>"
+        )
+
+        source = {"name": "Web Page", "url": "https://example.com/page", "type": "web"}
+        results = bps.fetch_web(source, bps.DEFAULT_KEYWORDS)
+        assert results[0]["excerpt"] == "AI governance matters"
+
+    @patch("best_practice_scanner._http_get")
+    def test_script_and_style_blocks_join_surrounding_text(self, mock_http_get):
+        """Test that script/style blocks are removed without leaving a space."""
+        mock_http_get.return_value = (
+            "gover<script>x()</script>nance <style a=1>b</style><script>c</script><p>ok"
+        )
+
+        source = {"name": "Web Page", "url": "https://example.com/page", "type": "web"}
+        results = bps.fetch_web(source, bps.DEFAULT_KEYWORDS)
+        assert results[0]["excerpt"] == "governance ok"
+
     @patch("best_practice_scanner._http_get")
     def test_web_fetch_failure_returns_empty(self, mock_http_get):
         """Test that web fetch errors return empty list."""
@@ -482,6 +568,20 @@ class TestScanSourcesRouting:
         keywords_arg = call_kwargs[0][1]  # second positional arg
         assert "custom keyword" in keywords_arg
 
+    @patch("best_practice_scanner.fetch_rss")
+    @patch("best_practice_scanner.fetch_web")
+    def test_multiple_sources_are_all_collected(self, mock_fetch_web, mock_fetch_rss):
+        """Test that findings from every source are combined and unknown types skipped."""
+        mock_fetch_web.return_value = [{"relevance_score": 0.2, "source": "web"}]
+        mock_fetch_rss.return_value = [{"relevance_score": 0.8, "source": "rss"}]
+        sources = [
+            {"name": "Web", "url": "https://example.com", "type": "web"},
+            {"name": "RSS", "url": "https://example.com/feed", "type": "rss"},
+            {"name": "Odd", "url": "https://example.com/odd", "type": "carrier-pigeon"},
+        ]
+        results = bps.scan_sources(sources, days=7)
+        assert [r["source"] for r in results] == ["rss", "web"]
+
 
 # ---------------------------------------------------------------------------
 # run — output and file writing
@@ -528,6 +628,25 @@ class TestRunFunction:
         content = (tmp_path / "output.json").read_text()
         assert "A" in content
 
+    @patch("best_practice_scanner.ORJSON_AVAILABLE", False)
+    def test_dump_findings_stdlib_fallback(self):
+        """Test that the stdlib fallback emits indented, non-ASCII-escaped JSON."""
+        findings = [{"title": "Kün", "relevance_score": 0.5, "tags": []}]
+        output = bps.dump_findings(findings)
+        assert output == json.dumps(findings, indent=2, ensure_ascii=False).encode()
+
+    def test_dump_findings_matches_stdlib_output(self):
+        """Test that orjson output matches the stdlib output byte for byte."""
+        pytest.importorskip("orjson")
+        assert bps.ORJSON_AVAILABLE
+        findings = [
+            {"source": "A", "title": "Kün", "url": "", "relevance_score": 0.33},
+            {"source": "B", "title": "T", "url": "x", "relevance_score": 1.0},
+        ]
+        with patch("best_practice_scanner.ORJSON_AVAILABLE", False):
+            expected = bps.dump_findings(findings)
+        assert bps.dump_findings(findings) == expected
+
     @patch("best_practice_scanner.scan_sources")
     def test_run_write_error_returns_one(self, mock_scan):
         """Test that run() returns exit code 1 when file write fails."""
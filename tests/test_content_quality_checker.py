@@ -0,0 +1,355 @@
+"""Tests for automation/content_quality_checker.py.
+
+Covers: line counting, section extraction, code-block detection, required
+section checks, grading, per-file checks, pattern/template discovery,
+the run_quality_check() report, and output formats.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import content_quality_checker as cqc
+
+PATTERN_BODY = (
+    "# Pattern: Example\n\n"
+    "## When to use\n\n"
+    + "".join(f"Guidance line {i}.\n" for i in range(30))
+    + "\n## Implementation\n\n```yaml\nkey: value\n```\n"
+)
+
+
+# ---------------------------------------------------------------------------
+# count_lines / extract_sections / has_code_block
+# ---------------------------------------------------------------------------
+
+
+class TestFileHelpers:
+    def test_count_lines_ignores_blank_lines(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("one\n\n   \ntwo\nthree\n", encoding="utf-8")
+        assert cqc.count_lines(path) == 3
+
+    def test_count_lines_missing_file_is_zero(self, tmp_path):
+        assert cqc.count_lines(tmp_path / "missing.md") == 0
+
+    def test_extract_sections_lowercases_h1_to_h3(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text(
+            "# Title\n## Session Protocol\n### Sub Part\n#### Too Deep\n",
+            encoding="utf-8",
+        )
+        assert cqc.extract_sections(path) == ["title", "session protocol", "sub part"]
+
+    def test_extract_sections_missing_file_is_empty(self, tmp_path):
+        assert cqc.extract_sections(tmp_path / "missing.md") == []
+
+    def test_has_code_block_detects_fence(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("Intro\n```python\nprint(1)\n```\n", encoding="utf-8")
+        assert cqc.has_code_block(path) is True
+
+    def test_has_code_block_detects_fence_on_first_line(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("```\ncode\n```\n", encoding="utf-8")
+        assert cqc.has_code_block(path) is True
+
+    def test_has_code_block_ignores_inline_backticks(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("Use ``` inline only\n", encoding="utf-8")
+        assert cqc.has_code_block(path) is False
+
+    def test_carriage_return_line_endings(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_bytes(b"# Title\r\n## Usage\rtext\r```\rcode\r```\r")
+        assert cqc.count_lines(path) == 6
+        assert cqc.extract_sections(path) == ["title", "usage"]
+        result = cqc.check_governance_file(tmp_path, "doc.md", cqc.TEMPLATE_RULES)
+        assert result["has_code_block"] is True
+
+    def test_undecodable_file_counts_as_empty(self, tmp_path):
+        path = tmp_path / "binary.md"
+        path.write_bytes(b"# Header\n\xff\xfe\n```\n")
+        assert cqc.count_lines(path) == 0
+        assert cqc.extract_sections(path) == []
+        assert cqc.has_code_block(path) is False
+
+    def test_invalid_utf8_after_fence_has_no_code_block(self, tmp_path):
+        path = tmp_path / "late.md"
+        path.write_bytes(b"```\ncode\n```\n" + b"text\n" * 1000 + b"\xff\n")
+        assert cqc.has_code_block(path) is False
+
+
+# ---------------------------------------------------------------------------
+# _scan_content
+# ---------------------------------------------------------------------------
+
+
+class TestScanContent:
+    CASES = (
+        "",
+        "# Title\n\nBody\n```\ncode\n```\n",
+        "#### Deep\n### Sub\n#NoSpace\n",
+        "#\n\n  Continued header\nnext\n",
+        "##   \n",
+        "# \n",
+        "Text\x0cmore\n# Head\n",
+        "  ```indented\n```\n",
+    )
+
+    def test_matches_individual_helpers(self):
+        for content in self.CASES:
+            assert cqc._scan_content(content) == (
+                cqc._count_content_lines(content),
+                cqc._extract_content_sections(content),
+                cqc._content_has_code_block(content),
+            ), content
+
+    def test_bare_marker_does_not_capture_next_line(self):
+        assert cqc._scan_content("#\n\nUsage notes\n")[1] == []
+
+    def test_tab_separated_header(self):
+        assert cqc._scan_content("##\tUsage\n")[1] == ["usage"]
+
+    def test_long_header_is_truncated(self):
+        content = "# " + "a" * (cqc.MAX_SECTION_NAME + 100) + "\n"
+        assert cqc._scan_content(content)[1] == ["a" * cqc.MAX_SECTION_NAME]
+        assert cqc._extract_content_sections(content) == ["a" * cqc.MAX_SECTION_NAME]
+
+
+# ---------------------------------------------------------------------------
+# check_required_sections
+# ---------------------------------------------------------------------------
+
+
+class TestCheckRequiredSections:
+    def test_substring_match_is_case_insensitive(self):
+        result = cqc.check_required_sections(
+            ["when to use this pattern", "notes"],
+            ["When to use", "Implementation"],
+            "any",
+        )
+        assert result == {"When to use": True, "Implementation": False}
+
+    def test_no_required_sections(self):
+        assert cqc.check_required_sections(["anything"], [], "all") == {}
+
+
+# ---------------------------------------------------------------------------
+# grade_file
+# ---------------------------------------------------------------------------
+
+
+class TestGradeFile:
+    def _grade(self, **overrides):
+        kwargs = {
+            "exists": True,
+            "line_count": 40,
+            "min_lines": 15,
+            "section_check": {"When to use": True},
+            "match_mode": "any",
+            "has_code": True,
+            "requires_code": False,
+        }
+        kwargs.update(overrides)
+        return cqc.grade_file(**kwargs)
+
+    def test_missing_file_is_f(self):
+        assert self._grade(exists=False) == "F"
+
+    def test_empty_file_is_f(self):
+        assert self._grade(line_count=0) == "F"
+
+    def test_too_short_is_c(self):
+        assert self._grade(line_count=10) == "C"
+
+    def test_missing_sections_is_c(self):
+        assert self._grade(section_check={"When to use": False}) == "C"
+
+    def test_all_mode_requires_every_section(self):
+        check = {"When to use": True, "Implementation": False}
+        assert self._grade(section_check=check, match_mode="all") == "C"
+        assert self._grade(section_check=check, match_mode="any") == "A"
+
+    def test_missing_required_code_is_b(self):
+        assert self._grade(requires_code=True, has_code=False) == "B"
+
+    def test_meets_minimum_only_is_b(self):
+        assert self._grade(line_count=20) == "B"
+
+    def test_generous_content_is_a(self):
+        assert self._grade(line_count=30) == "A"
+
+
+# ---------------------------------------------------------------------------
+# check_governance_file
+# ---------------------------------------------------------------------------
+
+
+class TestCheckGovernanceFile:
+    def test_missing_file(self, tmp_path):
+        result = cqc.check_governance_file(
+            tmp_path, "CLAUDE.md", cqc.QUALITY_RULES["CLAUDE.md"]
+        )
+        assert result["exists"] is False
+        assert result["quality_grade"] == "F"
+        assert result["line_count"] == 0
+
+    def test_pattern_file_with_sections_and_code(self, tmp_path):
+        (tmp_path / "patterns").mkdir()
+        (tmp_path / "patterns" / "example.md").write_text(
+            PATTERN_BODY, encoding="utf-8"
+        )
+        result = cqc.check_governance_file(
+            tmp_path, "patterns/example.md", cqc.PATTERN_RULES
+        )
+        assert result["exists"] is True
+        assert result["quality_grade"] == "A"
+        assert result["has_required_sections"] == {
+            "When to use": True,
+            "Implementation": True,
+        }
+        assert "has_code_block" not in result
+
+    def test_template_without_code_block_is_b(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "plain.md").write_text(
+            "Just text.\n", encoding="utf-8"
+        )
+        result = cqc.check_governance_file(
+            tmp_path, "templates/plain.md", cqc.TEMPLATE_RULES
+        )
+        assert result["quality_grade"] == "B"
+        assert result["has_code_block"] is False
+
+    def test_missing_template_reports_no_code_block(self, tmp_path):
+        result = cqc.check_governance_file(
+            tmp_path, "templates/gone.md", cqc.TEMPLATE_RULES
+        )
+        assert result["quality_grade"] == "F"
+        assert result["has_code_block"] is False
+
+
+# ---------------------------------------------------------------------------
+# find_pattern_files / find_template_files
+# ---------------------------------------------------------------------------
+
+
+class TestFindFiles:
+    def test_pattern_files_sorted_markdown_without_readme(self, tmp_path):
+        patterns = tmp_path / "patterns"
+        patterns.mkdir()
+        for name in ("b.md", "a.md", "README.md", "notes.txt"):
+            (patterns / name).write_text("x\n", encoding="utf-8")
+        (patterns / "nested.md").mkdir()
+        assert cqc.find_pattern_files(tmp_path) == ["patterns/a.md", "patterns/b.md"]
+
+    def test_template_files_include_any_extension(self, tmp_path):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        for name in ("CLAUDE.md", "workflow.yml", "README.md"):
+            (templates / name).write_text("x\n", encoding="utf-8")
+        assert cqc.find_template_files(tmp_path) == [
+            "templates/CLAUDE.md",
+            "templates/workflow.yml",
+        ]
+
+    def test_symlinked_pattern_file_is_included(self, tmp_path):
+        patterns = tmp_path / "patterns"
+        patterns.mkdir()
+        target = tmp_path / "shared.md"
+        target.write_text("x\n", encoding="utf-8")
+        (patterns / "linked.md").symlink_to(target)
+        assert cqc.find_pattern_files(tmp_path) == ["patterns/linked.md"]
+
+    def test_listing_refreshes_when_directory_changes(self, tmp_path):
+        patterns = tmp_path / "patterns"
+        patterns.mkdir()
+        (patterns / "a.md").write_text("x\n", encoding="utf-8")
+        assert cqc.find_pattern_files(tmp_path) == ["patterns/a.md"]
+        (patterns / "b.md").write_text("x\n", encoding="utf-8")
+        os.utime(patterns, ns=(0, patterns.stat().st_mtime_ns + 1_000_000))
+        assert cqc.find_pattern_files(tmp_path) == ["patterns/a.md", "patterns/b.md"]
+
+    def test_missing_directories_return_empty(self, tmp_path):
+        assert cqc.find_pattern_files(tmp_path) == []
+        assert cqc.find_template_files(tmp_path) == []
+
+
+# ---------------------------------------------------------------------------
+# run_quality_check and output formats
+# ---------------------------------------------------------------------------
+
+
+class TestRunQualityCheck:
+    def test_empty_repo_fails(self, tmp_path):
+        report = cqc.run_quality_check(tmp_path)
+        assert report["all_pass"] is False
+        assert report["summary"]["total_files"] == len(cqc.QUALITY_RULES)
+        assert report["summary"]["grade_f"] == len(cqc.QUALITY_RULES)
+
+    def test_full_repo_passes_in_file_order(self, tmp_path):
+        (tmp_path / "CLAUDE.md").write_text(
+            "# CLAUDE.md\n\n## conventions\n"
+            + "".join(f"- rule {i}\n" for i in range(25)),
+            encoding="utf-8",
+        )
+        (tmp_path / "README.md").write_text(
+            "".join(f"Line {i}\n" for i in range(45)), encoding="utf-8"
+        )
+        (tmp_path / "patterns").mkdir()
+        (tmp_path / "patterns" / "example.md").write_text(
+            PATTERN_BODY, encoding="utf-8"
+        )
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "t.md").write_text("```\nx\n```\n", encoding="utf-8")
+
+        report = cqc.run_quality_check(tmp_path)
+        assert report["all_pass"] is True
+        assert [f["file"] for f in report["files"]] == [
+            "CLAUDE.md",
+            "README.md",
+            "patterns/example.md",
+            "templates/t.md",
+        ]
+        assert report["summary"] == {
+            "total_files": 4,
+            "grade_a": 4,
+            "grade_b": 0,
+            "grade_c": 0,
+            "grade_f": 0,
+        }
+
+    def test_format_text_lists_files_and_overall(self, tmp_path):
+        report = cqc.run_quality_check(tmp_path)
+        text = cqc.format_text(report)
+        assert text.startswith("Content Quality Report\n")
+        assert "  [F] CLAUDE.md: 0 lines — FAIL" in text
+        assert text.endswith("Overall: FAIL")
+
+    def test_format_json_round_trips(self, tmp_path):
+        report = cqc.run_quality_check(tmp_path)
+        assert json.loads(cqc.format_json(report)) == report
+
+    def test_real_repo_reports_every_pattern(self, repo_root: Path):
+        report = cqc.run_quality_check(repo_root)
+        files = [f["file"] for f in report["files"]]
+        assert files == [
+            "CLAUDE.md",
+            "README.md",
+            *cqc.find_pattern_files(repo_root),
+            *cqc.find_template_files(repo_root),
+        ]
+        assert report["summary"]["total_files"] == len(files)
+
+
+# ---------------------------------------------------------------------------
+# build_parser
+# ---------------------------------------------------------------------------
+
+
+class TestBuildParser:
+    def test_defaults(self):
+        args = cqc.build_parser().parse_args([])
+        assert args.repo_path == Path(".")
+        assert args.output_format == "text"
@@ -1,8 +1,8 @@
 """Tests for automation/cost_dashboard.py.
 
 Covers: ASCII helpers (ascii_bar, sparkline, trend_arrow), model tier
-classification, COST_LOG.md parsing, routing recommendations, routing
-efficiency calculation, all section builders, full dashboard generation,
+classification, COST_LOG.md row splitting and parsing, routing recommendations, routing
+efficiency calculation, row aggregation, all section builders, full dashboard generation,
 CLI argument parser, and main() entry point including error paths.
 """
 
@@ -156,6 +156,25 @@ class TestClassifyModelTier:
         assert cd.classify_model_tier("claude-sonnet-3-5") == "sonnet"
 
 
+# ---------------------------------------------------------------------------
+# classify_session_type
+# ---------------------------------------------------------------------------
+
+
+class TestClassifySessionType:
+    def test_security_takes_priority(self):
+        assert cd.classify_session_type("Security, ADR, docs") == "security"
+
+    def test_arch_before_testing(self):
+        assert cd.classify_session_type("1 test, 1 ADR") == "architecture"
+
+    def test_docs_keyword(self):
+        assert cd.classify_session_type("3 Docs") == "documentation"
+
+    def test_default_is_feature(self):
+        assert cd.classify_session_type("4 code") == "feature"
+
+
 # ---------------------------------------------------------------------------
 # parse_cost_log
 # ---------------------------------------------------------------------------
@@ -226,6 +245,17 @@ class TestParseCostLog:
         rows = cd.parse_cost_log(tmp_path)
         assert [r["session"] for r in rows] == [1, 2, 3]
 
+    def test_late_out_of_order_row_is_sorted(self, tmp_path):
+        log = """\
+| 1 | 2025-01-01 | claude-sonnet-4 | 3 | feature | $0.050 | |
+| 2 | 2025-01-15 | claude-sonnet-4 | 4 | feature | $0.075 | |
+| 4 | 2025-02-01 | claude-sonnet-4 | 5 | feature | $0.100 | |
+| 3 | 2025-01-20 | claude-sonnet-4 | 5 | feature | $0.100 | |
+"""
+        (tmp_path / "COST_LOG.md").write_text(log, encoding="utf-8")
+        rows = cd.parse_cost_log(tmp_path)
+        assert [r["session"] for r in rows] == [1, 2, 3, 4]
+
     def test_adr_task_type_classified_as_architecture(self, tmp_path):
         log = """\
 # COST_LOG.md
@@ -273,6 +303,65 @@ class TestParseCostLog:
         assert rows[0]["tasks"] == 5
         assert rows[2]["tasks"] == 8
 
+    def test_undecodable_log_warns_and_returns_empty(self, tmp_path, capsys):
+        content = SAMPLE_COST_LOG.encode("utf-8") + b"| 4 | \xff\xfe |\n"
+        (tmp_path / "COST_LOG.md").write_bytes(content)
+        assert cd.parse_cost_log(tmp_path) == []
+        assert "Could not read" in capsys.readouterr().err
+
+    def test_row_without_notes_column_keeps_next_row(self, tmp_path):
+        log = """\
+| # | Date | Model | Tasks | Task Types | Cost |
+|---|------|-------|-------|------------|------|
+| 1 | 2025-01-01 | claude-sonnet-4 | 2 | feature | $0.050 |
+| 2 | 2025-01-02 | claude-sonnet-4 | 3 | feature | $0.060 |
+"""
+        (tmp_path / "COST_LOG.md").write_text(log, encoding="utf-8")
+        rows = cd.parse_cost_log(tmp_path)
+        assert [r["session"] for r in rows] == [1, 2]
+        assert [r["notes"] for r in rows] == ["", ""]
+
+    def test_non_table_lines_ignored(self, tmp_path):
+        log = "Budget: $5 per week\n| Model | $0.10 |\n" + SAMPLE_COST_LOG
+        (tmp_path / "COST_LOG.md").write_text(log, encoding="utf-8")
+        assert len(cd.parse_cost_log(tmp_path)) == 3
+
+
+# ---------------------------------------------------------------------------
+# split_cost_row
+# ---------------------------------------------------------------------------
+
+
+class TestSplitCostRow:
+    def test_full_row(self):
+        line = "| 7 | 2025-03-01 | claude-opus-4 | 2 | security | $0.280 | Review |"
+        assert cd.split_cost_row(line) == (
+            "7",
+            "2025-03-01",
+            "claude-opus-4",
+            "2",
+            "security",
+            "0.280",
+            "Review",
+        )
+
+    def test_unclosed_notes_cell_is_empty(self):
+        line = "| 7 | 2025-03-01 | m | 2 | docs | $0.28 | dangling"
+        assert cd.split_cost_row(line)[-1] == ""
+
+    def test_header_and_separator_rows_rejected(self):
+        assert (
+            cd.split_cost_row("| # | Date | Model | Tasks | Types | Cost | Notes |")
+            is None
+        )
+        assert cd.split_cost_row("|---|---|---|---|---|---|---|") is None
+
+    def test_malformed_cells_rejected(self):
+        assert cd.split_cost_row("| 1 | 2025-3-01 | m | 2 | t | $0.1 | |") is None
+        assert cd.split_cost_row("| 1 | 2025-03-01 | m | 2 | t | $ 0.1 | |") is None
+        assert cd.split_cost_row("| 1 | 2025-03-01 || 2 | t | $0.1 | |") is None
+        assert cd.split_cost_row("| 1 | 2025-03-01 | m | 2 | t | $0.1") is None
+
 
 # ---------------------------------------------------------------------------
 # routing_recommendation
@@ -426,6 +515,88 @@ class TestSectionDivider:
         assert result.startswith("\n")
 
 
+# ---------------------------------------------------------------------------
+# aggregate
+# ---------------------------------------------------------------------------
+
+
+class TestAggregate:
+    ROWS = (
+        {
+            "model": "m1",
+            "tier": "opus",
+            "session_type": "security",
+            "month": "2025-01",
+            "cost": 0.5,
+            "tasks": 2,
+        },
+        {
+            "model": "m2",
+            "tier": "sonnet",
+            "session_type": "feature",
+            "month": "2025-01",
+            "cost": 0.1,
+            "tasks": 3,
+        },
+        {
+            "model": "m1",
+            "tier": "opus",
+            "session_type": "feature",
+            "month": "2025-02",
+            "cost": 0.25,
+            "tasks": 1,
+        },
+    )
+
+    def test_overall_totals(self):
+        agg = cd.aggregate(self.ROWS)
+        assert agg.total_cost == pytest.approx(0.85)
+        assert agg.total_tasks == 6
+        assert agg.costs == [0.5, 0.1, 0.25]
+
+    def test_single_column_groups(self):
+        agg = cd.aggregate(self.ROWS)
+        by_model = agg.groups["model"]
+        assert by_model.sessions == {"m1": 2, "m2": 1}
+        assert by_model.tasks == {"m1": 3, "m2": 3}
+        assert by_model.cost == {"m1": 0.75, "m2": 0.1}
+        assert agg.groups["month"].sessions["2025-02"] == 1
+
+    def test_composite_group_key(self):
+        agg = cd.aggregate(self.ROWS)
+        pairs = agg.groups[("tier", "session_type")]
+        assert pairs.sessions[("opus", "feature")] == 1
+        assert ("sonnet", "security") not in pairs.sessions
+
+    def test_group_columns_share_keys(self):
+        agg = cd.aggregate(self.ROWS)
+        for totals in agg.groups.values():
+            assert list(totals.sessions) == list(totals.tasks) == list(totals.cost)
+
+    def test_only_requested_groups_are_built(self):
+        agg = cd.aggregate(self.ROWS, ("tier",))
+        assert list(agg.groups) == ["tier"]
+
+    def test_sections_match_with_and_without_aggregate(self):
+        agg = cd.aggregate(self.ROWS)
+        assert cd.build_model_breakdown_section(self.ROWS, agg) == (
+            cd.build_model_breakdown_section(self.ROWS)
+        )
+        assert cd.build_recommendations_section(self.ROWS, agg) == (
+            cd.build_recommendations_section(self.ROWS)
+        )
+
+    def test_routing_efficiency_uses_aggregate_total(self):
+        rows = [
+            dict(r, session=i, cost=c)
+            for i, (r, c) in enumerate(zip(self.ROWS, (0.1, 0.2, 0.3)), 1)
+        ]
+        agg = cd.aggregate(rows)
+        assert cd.compute_routing_efficiency(rows, agg) == (
+            cd.compute_routing_efficiency(rows)
+        )
+
+
 # ---------------------------------------------------------------------------
 # build_summary_section
 # ---------------------------------------------------------------------------
@@ -0,0 +1,415 @@
+"""Tests for automation/drift_detector.py.
+
+Covers: section extraction and section lengths, name normalization, alias
+resolution, length drift calculation, the on-disk section cache, and
+detect_drift reports.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import drift_detector as dd
+
+
+TEMPLATE = """\
+# CLAUDE.md
+
+## project_context
+Project context body with some descriptive text.
+
+## conventions
+Use snake_case. Keep functions short.
+
+## mandatory_session_protocol
+Start and end every session with the protocol.
+
+## security_protocol
+Never commit secrets.
+
+## quality_standards
+Tests for every change.
+"""
+
+
+def _write(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# extract_sections
+# ---------------------------------------------------------------------------
+
+
+class TestExtractSections:
+    def test_sections_keyed_by_normalized_header(self):
+        content = "## Project Context\nbody\n### Quality-Standards\nx\n"
+        sections = dd.extract_sections(content)
+        assert list(sections) == ["project_context", "quality_standards"]
+
+    def test_body_is_stripped(self):
+        sections = dd.extract_sections("## a\n\n  text  \n\n")
+        assert sections["a"] == "text"
+
+    def test_text_before_first_header_ignored(self):
+        assert dd.extract_sections("preamble\n## a\nbody\n") == {"a": "body"}
+
+    def test_level_four_header_is_body(self):
+        sections = dd.extract_sections("## a\n#### deep\n")
+        assert sections == {"a": "#### deep"}
+
+    def test_header_requires_whitespace_after_hashes(self):
+        assert dd.extract_sections("#tag\n## a\n") == {"a": ""}
+
+
+# ---------------------------------------------------------------------------
+# extract_section_lengths
+# ---------------------------------------------------------------------------
+
+
+class TestExtractSectionLengths:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            TEMPLATE,
+            "## a\n\n  text  \n\n",
+            "## a\n  lead\nmid\n trail  \n \n## b\n",
+            "preamble\n## a\n#### deep\n#tag\n",
+            "## a\n\t\n",
+            "",
+            "\n## a\nx\n#\n## b",
+            "## a\r\nbody\r\n## b\r\n",
+            "## a\x0cx\n## b\u2028## c\n",
+        ],
+    )
+    def test_matches_extracted_body_lengths(self, content):
+        expected = {k: len(v) for k, v in dd.extract_sections(content).items()}
+        assert dd.extract_section_lengths(content) == expected
+
+
+# ---------------------------------------------------------------------------
+# normalize_section_name / resolve_aliases
+# ---------------------------------------------------------------------------
+
+
+class TestNormalizeAndAliases:
+    def test_normalize_collapses_spaces_and_hyphens(self):
+        assert dd.normalize_section_name(" Session - Protocol ") == "session_protocol"
+
+    def test_alias_partner_resolved(self):
+        resolved = dd.resolve_aliases({"session_protocol"})
+        assert "mandatory_session_protocol" in resolved
+
+    def test_unrelated_names_unchanged(self):
+        assert dd.resolve_aliases({"conventions"}) == {"conventions"}
+
+
+# ---------------------------------------------------------------------------
+# calculate_drift
+# ---------------------------------------------------------------------------
+
+
+class TestCalculateDrift:
+    def test_within_threshold_not_drifted(self):
+        assert dd.calculate_drift({"a": "x" * 10}, {"a": "x" * 12}, 0.5) == []
+
+    def test_shorter_section_reported(self):
+        drifted = dd.calculate_drift({"a": "x" * 10}, {"a": "xx"}, 0.5)
+        assert drifted == [
+            {
+                "section": "a",
+                "template_length": 10,
+                "target_length": 2,
+                "ratio": 0.2,
+                "direction": "shorter",
+            }
+        ]
+
+    def test_sections_missing_from_target_skipped(self):
+        assert dd.calculate_drift({"a": "x"}, {}, 0.5) == []
+
+    def test_empty_template_section_skipped(self):
+        assert dd.calculate_drift({"a": ""}, {"a": "x" * 9}, 0.5) == []
+
+    def test_bodies_and_lengths_agree(self):
+        target = "## conventions\nx\n## quality_standards\n"
+        from_bodies = dd.calculate_drift(
+            dd.extract_sections(TEMPLATE), dd.extract_sections(target), 0.5
+        )
+        from_lengths = dd._calculate_drift_from_lengths(
+            dd.extract_section_lengths(TEMPLATE),
+            dd.extract_section_lengths(target),
+            0.5,
+        )
+        assert from_bodies == from_lengths
+        assert from_bodies
+
+
+# ---------------------------------------------------------------------------
+# extract_section_lengths_cached
+# ---------------------------------------------------------------------------
+
+
+class TestExtractSectionLengthsCached:
+    def test_without_cache_dir_matches_uncached(self):
+        assert dd.extract_section_lengths_cached(TEMPLATE) == (
+            dd.extract_section_lengths(TEMPLATE)
+        )
+
+    def test_miss_writes_entry(self, tmp_path):
+        sections = dd.extract_section_lengths_cached(TEMPLATE, tmp_path)
+        entries = list(tmp_path.glob("sections-*.json"))
+        assert len(entries) == 1
+        assert json.loads(entries[0].read_text(encoding="utf-8")) == sections
+
+    def test_hit_reads_entry(self, tmp_path):
+        dd.extract_section_lengths_cached(TEMPLATE, tmp_path)
+        entry = next(tmp_path.glob("sections-*.json"))
+        entry.write_text('{"from_cache": 1}', encoding="utf-8")
+        cached = dd.extract_section_lengths_cached(TEMPLATE, tmp_path)
+        assert cached == {"from_cache": 1}
+
+    def test_corrupt_entry_falls_back_to_parsing(self, tmp_path):
+        dd.extract_section_lengths_cached(TEMPLATE, tmp_path)
+        next(tmp_path.glob("sections-*.json")).write_text("{", encoding="utf-8")
+        assert dd.extract_section_lengths_cached(TEMPLATE, tmp_path) == (
+            dd.extract_section_lengths(TEMPLATE)
+        )
+
+    @pytest.mark.parametrize("bad", ['{"x": "y"}', '{"x": null}', '{"x": true}', "[]"])
+    def test_malformed_entry_falls_back_to_parsing(self, tmp_path, bad):
+        dd.extract_section_lengths_cached(TEMPLATE, tmp_path)
+        next(tmp_path.glob("sections-*.json")).write_text(bad, encoding="utf-8")
+        assert dd.extract_section_lengths_cached(TEMPLATE, tmp_path) == (
+            dd.extract_section_lengths(TEMPLATE)
+        )
+
+    def test_oldest_entries_pruned(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dd, "SECTION_CACHE_MAX_ENTRIES", 2)
+        for i in range(4):
+            dd.extract_section_lengths_cached(f"## s{i}\n", tmp_path)
+        assert len(list(tmp_path.glob("sections-*.json"))) == 2
+
+    def test_directory_listed_only_when_over_cap(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dd, "SECTION_CACHE_MAX_ENTRIES", 3)
+        dd.extract_section_lengths_cached("## first\n", tmp_path)
+        listed = []
+        real_prune = dd._prune_cache_dir
+        monkeypatch.setattr(
+            dd, "_prune_cache_dir", lambda d: listed.append(d) or real_prune(d)
+        )
+        for i in range(4):
+            dd.extract_section_lengths_cached(f"## s{i}\n", tmp_path)
+        assert len(listed) == 2
+        assert len(list(tmp_path.glob("sections-*.json"))) == 3
+
+    def test_concurrent_writes_of_one_entry(self, tmp_path):
+        entry = tmp_path / "sections-v2-0000000000000000.json"
+        lengths = {f"s{i}": i for i in range(2000)}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [
+                executor.submit(dd._write_cache_entry, entry, lengths)
+                for _ in range(32)
+            ]:
+                future.result()
+        assert json.loads(entry.read_text(encoding="utf-8")) == lengths
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+# ---------------------------------------------------------------------------
+# detect_drift
+# ---------------------------------------------------------------------------
+
+
+class TestDetectDrift:
+    def test_identical_files_are_aligned(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(tmp_path / "CLAUDE.md", TEMPLATE)
+        report = dd.detect_drift(template, target)
+        assert report["aligned"] is True
+        assert report["missing_sections"] == []
+        assert report["template_section_count"] == 6  # includes "# CLAUDE.md"
+
+    def test_identical_files_still_report_missing_sections(self, tmp_path):
+        content = "## conventions\nx\n"
+        template = _write(tmp_path / "template.md", content)
+        target = _write(tmp_path / "CLAUDE.md", content)
+        report = dd.detect_drift(template, target)
+        assert report["aligned"] is False
+        assert report["drift_sections"] == []
+        assert "project_context" in report["missing_sections"]
+
+    def test_directory_target_uses_claude_md(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        _write(tmp_path / "CLAUDE.md", TEMPLATE)
+        report = dd.detect_drift(template, tmp_path)
+        assert report["target"] == str(tmp_path / "CLAUDE.md")
+
+    def test_missing_sections_reported(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(tmp_path / "CLAUDE.md", "## conventions\nx\n")
+        report = dd.detect_drift(template, target)
+        assert report["missing_sections"] == [
+            "project_context",
+            "mandatory_session_protocol or session_protocol",
+            "security_protocol",
+            "quality_standards",
+        ]
+        assert report["aligned"] is False
+
+    def test_one_alias_satisfies_group(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(
+            tmp_path / "CLAUDE.md", TEMPLATE.replace("mandatory_session", "session")
+        )
+        report = dd.detect_drift(template, target)
+        assert report["missing_sections"] == []
+
+    def test_unreadable_template(self, tmp_path):
+        report = dd.detect_drift(tmp_path / "nope.md", tmp_path)
+        assert "error" in report
+        assert report["aligned"] is False
+
+    def test_missing_target_lists_all_required(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        report = dd.detect_drift(template, tmp_path / "missing.md")
+        assert report["missing_sections"] == dd.REQUIRED_SECTIONS
+
+    def test_cache_dir_gives_same_report(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(tmp_path / "CLAUDE.md", "## conventions\nshort\n")
+        cache = tmp_path / ".governance-cache"
+        plain = dd.detect_drift(template, target)
+        assert dd.detect_drift(template, target, cache_dir=cache) == plain
+        assert dd.detect_drift(template, target, cache_dir=cache) == plain
+        assert len(list(cache.glob("sections-*.json"))) == 2
+
+
+# ---------------------------------------------------------------------------
+# detect_drift in-process cache
+# ---------------------------------------------------------------------------
+
+
+class TestDetectDriftMemo:
+    def test_repeat_call_is_a_cache_hit(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(tmp_path / "CLAUDE.md", TEMPLATE)
+        first = dd.detect_drift(template, target)
+        hits = dd.detect_drift_cache_stats().hits
+        assert dd.detect_drift(template, target) == first
+        assert dd.detect_drift_cache_stats().hits == hits + 1
+
+    def test_edit_invalidates(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(tmp_path / "CLAUDE.md", TEMPLATE)
+        assert dd.detect_drift(template, target)["aligned"] is True
+        _write(target, "## conventions\n")
+        assert dd.detect_drift(template, target)["aligned"] is False
+
+    def test_returned_report_is_a_copy(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(tmp_path / "CLAUDE.md", "## conventions\n")
+        dd.detect_drift(template, target)["missing_sections"].clear()
+        assert dd.detect_drift(template, target)["missing_sections"]
+
+    def test_error_report_is_not_memoized(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = tmp_path / "CLAUDE.md"
+        target.write_bytes(b"\xff\xfe not utf-8")
+        size = dd.detect_drift_cache_stats().currsize
+        assert "error" in dd.detect_drift(template, target)
+        assert "error" in dd.detect_drift(template, target)
+        assert dd.detect_drift_cache_stats().currsize == size
+
+    def test_relative_path_keyed_by_resolved_path(self, tmp_path, monkeypatch):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        # Same size and mtime: only the resolved path tells them apart
+        _write(a / "CLAUDE.md", "## conventions\n")
+        _write(b / "CLAUDE.md", "## xonventions\n")
+        stamp = (a / "CLAUDE.md").stat().st_mtime_ns
+        os.utime(b / "CLAUDE.md", ns=(stamp, stamp))
+
+        monkeypatch.chdir(a)
+        from_a = dd.detect_drift(template, Path("CLAUDE.md"))
+        monkeypatch.chdir(b)
+        from_b = dd.detect_drift(template, Path("CLAUDE.md"))
+        assert from_a["missing_sections"] != from_b["missing_sections"]
+
+    def test_cache_clear_forces_a_fresh_read(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        target = _write(tmp_path / "CLAUDE.md", TEMPLATE)
+        dd.detect_drift(template, target)
+        dd.detect_drift_cache_clear()
+        assert dd.detect_drift_cache_stats().currsize == 0
+        misses = dd.detect_drift_cache_stats().misses
+        dd.detect_drift(template, target)
+        assert dd.detect_drift_cache_stats().misses == misses + 1
+
+
+# ---------------------------------------------------------------------------
+# detect_drift_many / main
+# ---------------------------------------------------------------------------
+
+
+class TestDetectDriftMany:
+    def test_reports_in_target_order(self, tmp_path):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        targets = []
+        for i in range(5):
+            project = tmp_path / f"p{i}"
+            project.mkdir()
+            _write(project / "CLAUDE.md", TEMPLATE if i % 2 else "## conventions\n")
+            targets.append(project)
+        reports = dd.detect_drift_many(template, targets)
+        assert [r["target"] for r in reports] == [str(t / "CLAUDE.md") for t in targets]
+        assert [r["aligned"] for r in reports] == [False, True, False, True, False]
+        assert reports == [dd.detect_drift(template, t) for t in targets]
+
+    def test_unreadable_template_reported_per_target(self, tmp_path):
+        reports = dd.detect_drift_many(tmp_path / "nope.md", [tmp_path, tmp_path])
+        assert len(reports) == 2
+        assert all("error" in r for r in reports)
+
+    def test_main_fails_if_any_target_drifted(self, tmp_path, monkeypatch, capsys):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        good = _write(tmp_path / "good.md", TEMPLATE)
+        bad = _write(tmp_path / "bad.md", "## conventions\n")
+        argv = ["drift_detector.py", "--template", str(template), "--format", "json"]
+        monkeypatch.setattr("sys.argv", argv + ["--target", str(good), str(bad)])
+        assert dd.main() == 1
+        reports = json.loads(capsys.readouterr().out)
+        assert [r["aligned"] for r in reports] == [True, False]
+
+    def test_main_single_target_prints_one_report(self, tmp_path, monkeypatch, capsys):
+        template = _write(tmp_path / "template.md", TEMPLATE)
+        argv = ["drift_detector.py", "--template", str(template), "--format", "json"]
+        monkeypatch.setattr("sys.argv", argv + ["--target", str(template)])
+        assert dd.main() == 0
+        assert json.loads(capsys.readouterr().out)["aligned"] is True
+
+
+# ---------------------------------------------------------------------------
+# build_parser
+# ---------------------------------------------------------------------------
+
+
+class TestBuildParser:
+    def test_defaults(self):
+        args = dd.build_parser().parse_args(["--template", "t", "--target", "c"])
+        assert args.threshold == pytest.approx(dd.DEFAULT_DRIFT_THRESHOLD)
+        assert args.output_format == "text"
+        assert args.cache_dir is None
+        assert args.target == [Path("c")]
+
+    def test_cache_dir_option(self):
+        args = dd.build_parser().parse_args(
+            ["--template", "t", "--target", "c", "--cache-dir", ".governance-cache"]
+        )
+        assert args.cache_dir == Path(".governance-cache")
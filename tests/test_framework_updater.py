@@ -4,6 +4,7 @@ Tests pure functions without network calls. GitHub API interactions
 are tested with mocked urllib responses.
 """
 
+import io
 import json
 import socket
 import urllib.error
@@ -110,6 +111,29 @@ class TestGetAvailableUpdates:
         updates = fu.get_available_updates([], "v1.0.0")
         assert updates == []
 
+    def test_current_between_releases(self):
+        releases = [
+            self._release("v1.0.0"),
+            self._release("v1.2.0"),
+            self._release("v1.10.0"),
+        ]
+        updates = fu.get_available_updates(releases, "v1.1.5")
+        assert [r["tag_name"] for r in updates] == ["v1.2.0", "v1.10.0"]
+
+    def test_unsorted_releases_are_filtered(self):
+        releases = [
+            self._release("v2.0.0"),
+            self._release("v0.9.0"),
+            self._release("v1.5.0"),
+            self._release("v1.0.0"),
+        ]
+        updates = fu.get_available_updates(releases, "v1.0.0")
+        assert [r["tag_name"] for r in updates] == ["v2.0.0", "v1.5.0"]
+
+    def test_current_newer_than_all_releases(self):
+        releases = [self._release("v1.0.0"), self._release("v1.1.0")]
+        assert fu.get_available_updates(releases, "v2.0.0") == []
+
 
 # ---------------------------------------------------------------------------
 # format_text / format_json
@@ -257,6 +281,228 @@ class TestFetchReleases:
         assert len(releases) == 2
         assert mock_urlopen.call_count == 2
 
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_pagination_stops_at_known_version(self, mock_urlopen):
+        """Test that no further pages are fetched once newer_than is reached."""
+        page1_link = '<https://api.github.com/repos/x/y/releases?page=2>; rel="next"'
+        mock_urlopen.return_value = _make_urlopen_mock(
+            [{"tag_name": "v2.0.0"}, {"tag_name": "v1.0.0"}], link_header=page1_link
+        )
+
+        releases = fu.fetch_releases(newer_than="v1.0.0")
+        assert [r["tag_name"] for r in releases] == ["v1.0.0", "v2.0.0"]
+        assert mock_urlopen.call_count == 1
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_pagination_continues_while_all_newer(self, mock_urlopen):
+        """Test that pages holding only newer or unparseable tags do not stop paging."""
+        page1_link = '<https://api.github.com/repos/x/y/releases?page=2>; rel="next"'
+        mock_page1 = _make_urlopen_mock(
+            [{"tag_name": "v3.0.0"}, {"tag_name": "nightly"}],
+            link_header=page1_link,
+        )
+        mock_page2 = _make_urlopen_mock([{"tag_name": "v1.0.0"}])
+        mock_urlopen.side_effect = [mock_page1, mock_page2]
+
+        fu.fetch_releases(newer_than="v1.0.0")
+        assert mock_urlopen.call_count == 2
+
+
+class TestSlimRelease:
+    """Tests for trimming release payloads to the fields the report uses."""
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_unused_fields_dropped(self, mock_urlopen):
+        mock_urlopen.return_value = _make_urlopen_mock(
+            [
+                {
+                    "tag_name": "v1.0.0",
+                    "html_url": "https://example.com",
+                    "author": {"login": "someone"},
+                    "assets": [{"name": "a.tar.gz", "size": 1, "uploader": {}}],
+                }
+            ]
+        )
+        releases = fu.fetch_releases()
+        assert releases == [
+            {
+                "tag_name": "v1.0.0",
+                "html_url": "https://example.com",
+                "assets": [{"name": "a.tar.gz", "size": 1}],
+            }
+        ]
+
+    def test_long_body_keeps_truncation_marker(self):
+        release = fu._slim_release({"tag_name": "v1.1.0", "body": "A" * 5000})
+        assert len(release["body"]) == fu.RELEASE_NOTES_EXCERPT + 1
+        text = fu.format_text("v1.0.0", "v1.1.0", [release], check_only=False)
+        assert "A" * fu.RELEASE_NOTES_EXCERPT + "..." in text
+
+    def test_short_and_null_bodies_unchanged(self):
+        assert fu._slim_release({"body": "Notes."}) == {"body": "Notes."}
+        assert fu._slim_release({"body": None}) == {"body": None}
+
+
+def _make_not_modified_error() -> urllib.error.HTTPError:
+    """Helper: the HTTPError urllib raises for a 304 Not Modified response."""
+    return urllib.error.HTTPError(
+        "https://api.github.com", 304, "Not Modified", {}, None
+    )
+
+
+class TestFetchReleasesCache:
+    """Tests for ETag revalidation of cached release pages."""
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_first_fetch_writes_cache(self, mock_urlopen, tmp_path):
+        mock_urlopen.return_value = _make_urlopen_mock([{"tag_name": "v1.0.0"}])
+        fu.fetch_releases(cache_dir=tmp_path)
+        pages = json.loads((tmp_path / fu.RELEASES_CACHE_FILE).read_text())
+        assert [p["data"] for p in pages.values()] == [[{"tag_name": "v1.0.0"}]]
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_not_modified_uses_cached_page(self, mock_urlopen, tmp_path):
+        response = _make_urlopen_mock([{"tag_name": "v1.0.0"}])
+        response.headers.get.side_effect = lambda key, default="": (
+            '"abc"' if key == "ETag" else default
+        )
+        mock_urlopen.return_value = response
+        fu.fetch_releases(cache_dir=tmp_path)
+
+        mock_urlopen.side_effect = _make_not_modified_error()
+        releases = fu.fetch_releases(cache_dir=tmp_path)
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"abc"'
+        assert [r["tag_name"] for r in releases] == ["v1.0.0"]
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_not_modified_response_is_closed(self, mock_urlopen, tmp_path):
+        mock_urlopen.return_value = _make_urlopen_mock([{"tag_name": "v1.0.0"}])
+        fu.fetch_releases(cache_dir=tmp_path)
+
+        body = io.BytesIO(b"")
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            "https://api.github.com", 304, "Not Modified", {}, body
+        )
+        fu.fetch_releases(cache_dir=tmp_path)
+        assert body.closed
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_last_modified_fallback(self, mock_urlopen, tmp_path):
+        date = "Wed, 01 Jan 2025 00:00:00 GMT"
+        response = _make_urlopen_mock([{"tag_name": "v1.0.0"}])
+        response.headers.get.side_effect = lambda key, default="": (
+            date if key == "Last-Modified" else default
+        )
+        mock_urlopen.return_value = response
+        fu.fetch_releases(cache_dir=tmp_path)
+
+        mock_urlopen.side_effect = _make_not_modified_error()
+        releases = fu.fetch_releases(cache_dir=tmp_path)
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-modified-since") == date
+        assert request.get_header("If-none-match") is None
+        assert [r["tag_name"] for r in releases] == ["v1.0.0"]
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_not_modified_without_cache_raises(self, mock_urlopen, tmp_path):
+        mock_urlopen.side_effect = _make_not_modified_error()
+        with pytest.raises(urllib.error.HTTPError):
+            fu.fetch_releases(cache_dir=tmp_path)
+
+    @pytest.mark.parametrize(
+        "page",
+        [
+            {"etag": '"abc"'},
+            {"etag": '"abc"', "data": "oops"},
+            {"etag": '"abc"', "data": ["oops"]},
+            {"etag": 1, "data": []},
+            "oops",
+        ],
+    )
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_malformed_page_entry_is_refetched(self, mock_urlopen, tmp_path, page):
+        mock_urlopen.return_value = _make_urlopen_mock([{"tag_name": "v1.0.0"}])
+        fu.fetch_releases(cache_dir=tmp_path)
+        cache_file = tmp_path / fu.RELEASES_CACHE_FILE
+        url = next(iter(json.loads(cache_file.read_text())))
+        cache_file.write_text(json.dumps({url: page}))
+
+        releases = fu.fetch_releases(cache_dir=tmp_path)
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") is None
+        assert [r["tag_name"] for r in releases] == ["v1.0.0"]
+
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_no_cache_dir_writes_nothing(self, mock_urlopen, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_urlopen.return_value = _make_urlopen_mock([{"tag_name": "v1.0.0"}])
+        fu.fetch_releases()
+        assert list(tmp_path.iterdir()) == []
+
+
+def _make_http_error(code: int, headers=None) -> urllib.error.HTTPError:
+    """Helper: an HTTPError with the given status code and headers."""
+    return urllib.error.HTTPError(
+        "https://api.github.com", code, "error", headers or {}, None
+    )
+
+
+class TestFetchReleasesRetry:
+    """Tests for retrying transient GitHub API errors."""
+
+    @patch("framework_updater.time.sleep")
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_retries_server_error_then_succeeds(self, mock_urlopen, mock_sleep):
+        mock_urlopen.side_effect = [
+            _make_http_error(503),
+            _make_http_error(502),
+            _make_urlopen_mock([{"tag_name": "v1.0.0"}]),
+        ]
+        releases = fu.fetch_releases()
+        assert [r["tag_name"] for r in releases] == ["v1.0.0"]
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.3, 0.6]
+
+    @patch("framework_updater.time.sleep")
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_gives_up_after_max_retries(self, mock_urlopen, mock_sleep):
+        mock_urlopen.side_effect = _make_http_error(500)
+        with pytest.raises(urllib.error.HTTPError):
+            fu.fetch_releases()
+        assert mock_urlopen.call_count == fu.MAX_RETRIES + 1
+
+    @patch("framework_updater.time.sleep")
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_honours_retry_after_with_cap(self, mock_urlopen, mock_sleep):
+        mock_urlopen.side_effect = [
+            _make_http_error(429, {"Retry-After": "2"}),
+            _make_http_error(429, {"Retry-After": "3600"}),
+            _make_urlopen_mock([]),
+        ]
+        fu.fetch_releases()
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [
+            2.0,
+            fu.MAX_RETRY_DELAY_SECONDS,
+        ]
+
+    @patch("framework_updater.time.sleep")
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_retried_error_response_is_closed(self, mock_urlopen, mock_sleep):
+        body = io.BytesIO(b"busy")
+        error = urllib.error.HTTPError("https://api.github.com", 503, "busy", {}, body)
+        mock_urlopen.side_effect = [error, _make_urlopen_mock([])]
+        fu.fetch_releases()
+        assert body.closed
+
+    @patch("framework_updater.time.sleep")
+    @patch("framework_updater.urllib.request.urlopen")
+    def test_client_error_not_retried(self, mock_urlopen, mock_sleep):
+        mock_urlopen.side_effect = _make_http_error(404)
+        with pytest.raises(urllib.error.HTTPError):
+            fu.fetch_releases()
+        assert mock_urlopen.call_count == 1
+        mock_sleep.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # show_apply_diff
@@ -493,6 +739,8 @@ class TestBuildParser:
         assert args.check_only is False
         assert args.output_format == "text"
         assert args.apply is False
+        assert args.cache_dir is None
+        assert args.no_cache is False
 
     def test_parser_with_all_args(self):
         """Test parser with all arguments supplied."""